@@ -5,13 +5,16 @@ from pathlib import Path
 from loguru import logger
 
 from .cli import commands
+from .core.store import DEFAULT_CONFIG_PATH
 
 class CLI:
     """GitHub Issue Store CLI"""
     
     def __init__(self):
         """Initialize CLI with default config path"""
-        self.default_config_path = Path.home() / ".config" / "gh-store" / "config.yml"
+        self.default_config_path = DEFAULT_CONFIG_PATH
+        # Clock used to stamp snapshots; private so fire doesn't expose it
+        self._now = commands.utcnow
     
     def process_updates(
         self,
@@ -31,7 +34,7 @@ class CLI:
         config: str | None = None,
     ) -> None:
         """Create a full snapshot of all objects in the store"""
-        return commands.snapshot(token, repo, output, config)
+        return commands.snapshot(token, repo, output, config, now=self._now)
 
     def update_snapshot(
         self,
@@ -41,7 +44,7 @@ class CLI:
         config: str | None = None,
     ) -> None:
         """Update an existing snapshot with changes since its creation"""
-        return commands.update_snapshot(snapshot_path, token, repo, config)
+        return commands.update_snapshot(snapshot_path, token, repo, config, now=self._now)
 
     def init(
         self,
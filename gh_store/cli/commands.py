@@ -7,12 +7,125 @@ from datetime import datetime
 from zoneinfo import ZoneInfo
 import shutil
 import importlib.resources
-from typing import Any
+from typing import Any, Callable, Iterable
 from loguru import logger
 
 from ..core.store import GitHubStore
 from ..core.exceptions import GitHubStoreError, ConfigurationError
-from ..core.types import Json
+from ..core.types import Json, StoredObject
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+
+def utcnow() -> datetime:
+    """Current UTC time, used to stamp snapshots"""
+    return datetime.now(ZoneInfo("UTC"))
+
+# Largest integer range orjson can serialize
+_ORJSON_INT_MIN = -(2 ** 63)
+_ORJSON_INT_MAX = 2 ** 64 - 1
+
+def _orjson_compatible_str(text: str) -> bool:
+    """ASCII text other than DEL, which json.dumps escapes and orjson doesn't"""
+    return text.isascii() and "\x7f" not in text
+
+def _orjson_compatible(value: Any) -> bool:
+    """
+    Check that orjson would write value exactly as the stdlib path does.
+    
+    orjson writes non-ASCII text unescaped, formats float exponents differently
+    (1e16 vs 1e+16), rejects integers beyond 64 bits and serializes types the
+    stdlib refuses, so it is only used for ASCII strings (DEL aside), bounded ints, bools,
+    None and containers of them.
+    """
+    value_type = type(value)
+    if value_type is str:
+        return _orjson_compatible_str(value)
+    if value_type is bool or value is None:
+        return True
+    if value_type is int:
+        return _ORJSON_INT_MIN <= value <= _ORJSON_INT_MAX
+    if value_type is dict:
+        return all(
+            type(key) is str and _orjson_compatible_str(key) and _orjson_compatible(item)
+            for key, item in value.items()
+        )
+    if value_type is list or value_type is tuple:
+        return all(_orjson_compatible(item) for item in value)
+    return False
+
+def _dump_json(data: Json) -> bytes:
+    """
+    Serialize CLI output as indented, ASCII-escaped JSON bytes.
+    
+    orjson is used when installed and the data is plain enough that it writes
+    the same bytes as json.dumps(indent=2); anything else goes through the
+    stdlib, so output never depends on the optional extra.
+    """
+    if orjson is not None and _orjson_compatible(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:  # e.g. nesting deeper than orjson allows
+            pass
+    return json.dumps(data, indent=2).encode()
+
+def _snapshot_entry(obj: StoredObject) -> dict[str, Json]:
+    """Build the snapshot representation of a stored object"""
+    return {
+        "data": obj.data,
+        "meta": {
+            "issue_number": obj.meta.issue_number,
+            "object_id": obj.meta.object_id, # there's also an obj.meta.label field we can probably just drop?
+            "created_at": obj.meta.created_at.isoformat(),
+            "updated_at": obj.meta.updated_at.isoformat(),
+            "version": obj.meta.version,
+        }
+    }
+
+def _write_snapshot(
+    output_path: Path,
+    header: dict[str, Json],
+    entries: Iterable[tuple[str, Json]],
+) -> int:
+    """
+    Stream a snapshot to disk one object at a time.
+    
+    The header fields are written first, followed by an "objects" mapping built
+    from the (object_id, entry) pairs. Each entry is written as soon as it
+    arrives, so only one object needs to be held in memory at a time. Since an
+    entry can't be taken back once written, a repeated object ID keeps its
+    first entry and later ones are skipped with a warning. Output goes to a
+    temporary file that replaces output_path once complete and is removed if
+    writing fails. Returns the number of objects written.
+    """
+    def _nested(value: Json, depth: int) -> bytes:
+        return _dump_json(value).replace(b"\n", b"\n" + b"  " * depth)
+    
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    seen: set[str] = set()
+    try:
+        with tmp_path.open("wb") as f:
+            f.write(b"{\n")
+            for key, value in header.items():
+                f.writelines((b"  ", _dump_json(key), b": ", _nested(value, 1), b",\n"))
+            f.write(b'  "objects": {')
+            for object_id, entry in entries:
+                if object_id in seen:
+                    logger.warning(f"Skipping duplicate entry for object {object_id}; keeping the first one")
+                    continue
+                f.write(b",\n" if seen else b"\n")
+                # Hand the pieces to the file as-is rather than joining each entry into another copy
+                f.writelines((b"    ", _dump_json(object_id), b": ", _nested(entry, 2)))
+                seen.add(object_id)
+            f.write(b"\n  }\n}" if seen else b"}\n}")
+        tmp_path.replace(output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return len(seen)
 
 
 def ensure_config_exists(config_path: Path) -> None:
@@ -61,10 +174,10 @@ def get(
         }
         
         if output:
-            Path(output).write_text(json.dumps(result, indent=2))
+            Path(output).write_bytes(_dump_json(result))
             logger.info(f"Object written to {output}")
         else:
-            print(json.dumps(result, indent=2))
+            print(_dump_json(result).decode())
             
     except Exception as e:
         logger.exception("Failed to get object")
@@ -143,10 +256,10 @@ def get_history(
         history = store.get_object_history(object_id)
         
         if output:
-            Path(output).write_text(json.dumps(history, indent=2))
+            Path(output).write_bytes(_dump_json(history))
             logger.info(f"History written to {output}")
         else:
-            print(json.dumps(history, indent=2))
+            print(_dump_json(history).decode())
             
     except Exception as e:
         logger.exception("Failed to get object history")
@@ -176,6 +289,7 @@ def snapshot(
     repo: str | None = None,
     output: str = "snapshot.json",
     config: str | None = None,
+    now: Callable[[], datetime] = utcnow,
 ) -> None:
     """Create a full snapshot of all objects in the store, including relationship info."""
     try:
@@ -187,18 +301,17 @@ def snapshot(
         
         try:
             from gh_store.tools.canonicalize import CanonicalStore
-            canonical_store = CanonicalStore(token, repo, config_path=Path(config) if config else None)
+            canonical_store = CanonicalStore(token, repo, config=store.config)
             has_canonical = True
         except ImportError:
             logger.warning("Canonical store functionality not available")
         except Exception as e:
             logger.warning(f"Error initializing canonical store: {e}")
         
-        # Create snapshot data
+        # Create snapshot header
         snapshot_data = {
-            "snapshot_time": datetime.now(ZoneInfo("UTC")).isoformat(),
+            "snapshot_time": now().isoformat(),
             "repository": repo or os.environ.get("GITHUB_REPOSITORY", ""),
-            "objects": {},
         }
         
         # Add relationships data if CanonicalStore is available
@@ -213,24 +326,13 @@ def snapshot(
             except Exception as e:
                 logger.warning(f"Error finding aliases: {e}")
         
-        # Add objects to snapshot
-        object_count = 0
-        for obj in store.list_all():
-            object_count += 1
-            snapshot_data["objects"][obj.meta.object_id] = {
-                "data": obj.data,
-                "meta": {
-                    "issue_number": obj.meta.issue_number,
-                    "object_id": obj.meta.object_id, # there's also an obj.meta.label field we can probably just drop?
-                    "created_at": obj.meta.created_at.isoformat(),
-                    "updated_at": obj.meta.updated_at.isoformat(),
-                    "version": obj.meta.version,
-                }
-            }
-        
-        # Write to file
+        # Stream objects into the snapshot file
         output_path = Path(output)
-        output_path.write_text(json.dumps(snapshot_data, indent=2))
+        object_count = _write_snapshot(
+            output_path,
+            snapshot_data,
+            ((obj.meta.object_id, _snapshot_entry(obj)) for obj in store.list_all()),
+        )
         logger.info(f"Snapshot written to {output_path}")
         logger.info(f"Captured {object_count} objects")
         
@@ -250,6 +352,7 @@ def update_snapshot(
     token: str | None = None,
     repo: str | None = None,
     config: str | None = None,
+    now: Callable[[], datetime] = utcnow,
 ) -> None:
     """Update an existing snapshot with changes since its creation"""
     try:
@@ -260,8 +363,7 @@ def update_snapshot(
         if not snapshot_path.exists():
             raise FileNotFoundError(f"Snapshot file not found: {snapshot_path}")
         
-        with open(snapshot_path) as f:
-            snapshot_data = json.loads(f.read())
+        snapshot_data = json.loads(snapshot_path.read_bytes())
         
         # Parse snapshot timestamp
         last_snapshot = datetime.fromisoformat(snapshot_data["snapshot_time"])
@@ -274,23 +376,15 @@ def update_snapshot(
         for obj in store.list_updated_since(last_snapshot):
             # We only get here if the object passed the timestamp check in list_updated_since
             updated_count += 1
-            snapshot_data["objects"][obj.meta.object_id] = {
-                "data": obj.data,
-                "meta": {
-                    "issue_number": obj.meta.issue_number,
-                    "object_id": obj.meta.object_id, # there's also an obj.meta.label field we can probably just drop?
-                    "created_at": obj.meta.created_at.isoformat(),
-                    "updated_at": obj.meta.updated_at.isoformat(),
-                    "version": obj.meta.version,
-                }
-            }
+            snapshot_data["objects"][obj.meta.object_id] = _snapshot_entry(obj)
         
         # Only update snapshot timestamp if we actually updated objects
         if updated_count > 0:
-            snapshot_data["snapshot_time"] = datetime.now(ZoneInfo("UTC")).isoformat()
+            snapshot_data["snapshot_time"] = now().isoformat()
             
             # Write updated snapshot
-            snapshot_path.write_text(json.dumps(snapshot_data, indent=2))
+            objects = snapshot_data.pop("objects")
+            _write_snapshot(snapshot_path, snapshot_data, objects.items())
             logger.info(f"Updated {updated_count} objects in snapshot")
         else:
             logger.info("No updates found since last snapshot")
@@ -41,11 +41,9 @@ class AccessControl:
         if self._codeowners is not None:
             return self._codeowners
 
+        # A missing file is cached too, so later checks don't re-probe every path
         content = self._find_codeowners_file()
-        if not content:
-            return set()
-
-        self._codeowners = self._parse_codeowners_content(content)
+        self._codeowners = self._parse_codeowners_content(content) if content else set()
         return self._codeowners
     
     def _find_codeowners_file(self) -> str | None:
@@ -1,13 +1,15 @@
 # gh_store/core/store.py
 
 from collections.abc import Iterator
+import copy
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 import importlib.resources
 
 from loguru import logger
 from github import Github
-from omegaconf import OmegaConf
+from omegaconf import DictConfig, OmegaConf
 
 from ..core.access import AccessControl
 from ..core.constants import LabelNames
@@ -19,6 +21,36 @@ from .types import StoredObject, Update, Json
 
 DEFAULT_CONFIG_PATH = Path.home() / ".config" / "gh-store" / "config.yml"
 
+# GitHub's maximum page size; listing issues for snapshots walks every page
+GITHUB_PAGE_SIZE = 100
+
+
+@lru_cache(maxsize=32)
+def _load_config(path: Path, mtime_ns: int) -> DictConfig:
+    """
+    Parse a config file, memoized on its resolved path and modification time.
+    
+    Editing the file changes its mtime, so the next store picks up the new
+    contents. The cached parse is read-only; stores take a copy of it.
+    """
+    config = OmegaConf.load(path)
+    OmegaConf.set_readonly(config, True)
+    return config
+
+@lru_cache(maxsize=1)
+def _load_default_config() -> DictConfig:
+    """Parse the config packaged with gh-store, once per process. Read-only, like _load_config."""
+    with importlib.resources.files('gh_store').joinpath('default_config.yml').open('rb') as f:
+        config = OmegaConf.load(f)
+    OmegaConf.set_readonly(config, True)
+    return config
+
+def _copy_config(config: DictConfig) -> DictConfig:
+    """Writable copy of a cached config, so changes made through one store don't reach others"""
+    config = copy.deepcopy(config)
+    OmegaConf.set_readonly(config, None)
+    return config
+
 class GitHubStore:
     """Interface for storing and retrieving objects using GitHub Issues"""
     
@@ -28,23 +60,32 @@ class GitHubStore:
         token: str|None = None,
         config_path: Path | None = None,
         max_concurrent_updates: int = 2, # upper limit number of comments to be processed on an issue before we stop adding updates
+        config: DictConfig | None = None,
     ):
-        """Initialize the store with GitHub credentials and optional config"""
-        self.gh = Github(token)
+        """
+        Initialize the store with GitHub credentials and optional config.
+        
+        An already-loaded config takes precedence over config_path, letting
+        callers that build several stores share one parsed config. Otherwise
+        each store gets its own copy of the config, parsed once per file.
+        """
+        self.gh = Github(token, per_page=GITHUB_PAGE_SIZE)
         self.repo = self.gh.get_repo(repo)
         self.access_control = AccessControl(self.repo)
         self.max_concurrent_updates = max_concurrent_updates
         
         config_path = config_path or DEFAULT_CONFIG_PATH
-        if not config_path.exists():
+        if config is not None:
+            self.config = config
+        elif not config_path.exists():
             # If default config doesn't exist, but we have a packaged default, use that
             if config_path == DEFAULT_CONFIG_PATH:
-                with importlib.resources.files('gh_store').joinpath('default_config.yml').open('rb') as f:
-                    self.config = OmegaConf.load(f)
+                self.config = _copy_config(_load_default_config())
             else:
                 raise FileNotFoundError(f"Config file not found: {config_path}")
         else:
-            self.config = OmegaConf.load(config_path)
+            config_path = config_path.resolve()
+            self.config = _copy_config(_load_config(config_path, config_path.stat().st_mtime_ns))
         
         self.issue_handler = IssueHandler(self.repo, self.config)
         self.comment_handler = CommentHandler(self.repo, self.config)
@@ -118,14 +159,17 @@ class GitHubStore:
             labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT]
         )
         
-        for idx, issue in enumerate(issues_generator):
+        n_found = 0
+        for issue in issues_generator:
             if any(label.name == "archived" for label in issue.labels):
                 continue
             try:
                 yield StoredObject.from_issue(issue)
             except ValueError as e:
-                logger.warning(f"Skipping issue #{issue.number}: {e}")        
-        logger.info(f"Found {idx+1} stored objects")
+                logger.warning(f"Skipping issue #{issue.number}: {e}")
+                continue
+            n_found += 1
+        logger.info(f"Found {n_found} stored objects")
     
     def list_updated_since(self, timestamp: datetime) -> Iterator[StoredObject]:
         """
@@ -160,14 +204,16 @@ class GitHubStore:
             if any(label.name == "archived" for label in issue.labels):
                 continue
                 
+            # Double check the timestamp (since GitHub's since parameter includes issues with comments after the timestamp)
+            # before paying to parse the body
+            if issue.updated_at <= timestamp:
+                logger.debug(f"Skipping issue #{issue.number}: last updated at {issue.updated_at}, before {timestamp}")
+                continue
+            
             try:
                 obj = StoredObject.from_issue(issue)
-                # Double check the timestamp (since GitHub's since parameter includes issues with comments after the timestamp)
-                if obj.meta.updated_at > timestamp:
-                    yielded_count += 1
-                    yield obj
-                else:
-                    logger.debug(f"Skipping issue #{issue.number}: last updated at {obj.meta.updated_at}, before {timestamp}")
+                yielded_count += 1
+                yield obj
             except ValueError as e:
                 logger.warning(f"Skipping issue #{issue.number}: {e}")
         
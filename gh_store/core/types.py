@@ -11,6 +11,10 @@ from .constants import LabelNames
 
 Json: TypeAlias = dict[str, "Json"] | list["Json"] | str | int | float | bool | None
 
+# Plain-str copies of the UID prefix, so label scans skip the enum member lookup
+_UID_PREFIX = LabelNames.UID_PREFIX.value
+_UID_PREFIX_LEN = len(_UID_PREFIX)
+
 
 # This one method feels like it belongs on the IssueHandler, but really it pairs with StoredObject.from_issue
 def get_object_id_from_labels(issue: Issue) -> str:
@@ -31,8 +35,8 @@ def get_object_id_from_labels(issue: Issue) -> str:
         # ... or are we just mocking poorly?
         label_name = getattr(label, 'name', label)
         
-        if (isinstance(label_name, str) and label_name.startswith(LabelNames.UID_PREFIX)):
-            return label_name[len(LabelNames.UID_PREFIX):]
+        if (isinstance(label_name, str) and label_name.startswith(_UID_PREFIX)):
+            return label_name[_UID_PREFIX_LEN:]
             
     raise ValueError(f"No UID label found with prefix {LabelNames.UID_PREFIX}")
 
@@ -15,6 +15,8 @@ from ..core.version import CLIENT_VERSION
 class CommentHandler:
     """Handles processing of update comments"""
     
+    REQUIRED_META_FIELDS = ('client_version', 'timestamp', 'update_mode')
+    
     def __init__(self, repo: Repository.Repository, config: DictConfig):
         self.repo = repo
         self.config = config
@@ -24,9 +26,8 @@ class CommentHandler:
 
     def _validate_metadata(self, metadata: dict) -> bool:
         """Validate that metadata contains all required fields"""
-        return all(
-            key in metadata and metadata[key] is not None
-            for key in ['client_version', 'timestamp', 'update_mode']
+        return isinstance(metadata, dict) and all(
+            metadata.get(key) is not None for key in self.REQUIRED_META_FIELDS
         )
 
     def get_unprocessed_updates(self, issue_number: int) -> list[Update]:
@@ -129,6 +130,12 @@ class CommentHandler:
 
     def _is_processed(self, comment: IssueComment.IssueComment) -> bool:
         """Check if a comment has been processed"""
+        # Listed comments carry per-emoji reaction counts, which answer this
+        # without a separate reactions request per comment
+        summary = comment.reactions
+        if isinstance(summary, dict) and self.processed_reaction in summary:
+            return summary[self.processed_reaction] > 0
+        
         for reaction in comment.get_reactions():
             if reaction.content == self.processed_reaction:
                 return True
@@ -139,7 +146,7 @@ class CommentHandler:
         result = base.copy()
         
         for key, value in update.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+            if isinstance(value, dict) and isinstance(result.get(key), dict):
                 result[key] = self._deep_merge(result[key], value)
             else:
                 result[key] = value
@@ -1,6 +1,5 @@
 # gh_store/handlers/issue.py
 
-from datetime import datetime, timezone
 from loguru import logger
 from github import Repository, Issue
 import json
@@ -8,8 +7,7 @@ from omegaconf import DictConfig
 
 from ..core.constants import LabelNames
 from ..core.exceptions import ObjectNotFound, DuplicateUIDError
-from ..core.types import StoredObject, ObjectMeta, Json, CommentPayload, CommentMeta
-from ..core.version import CLIENT_VERSION
+from ..core.types import StoredObject, ObjectMeta, Json
 from .comment import CommentHandler
 
 
@@ -222,16 +220,7 @@ class IssueHandler:
         issue = issues[0]
         
         # Create update payload with metadata
-        update_payload = CommentPayload(
-            _data=changes,
-            _meta=CommentMeta(
-                client_version=CLIENT_VERSION,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                issue_number=issue.number,  # Include issue number
-                update_mode="append"
-            ),
-            type=None
-        )
+        update_payload = CommentHandler.create_comment_payload(changes, issue.number)
         
         # Add update comment
         issue.create_comment(json.dumps(update_payload.to_dict(), indent=2))
@@ -19,6 +19,7 @@ from loguru import logger
 from github import Github
 from github.Issue import Issue
 from github.Repository import Repository
+from omegaconf import DictConfig
 
 from ..core.constants import LabelNames, DeprecationReason
 from ..core.exceptions import ObjectNotFound
@@ -30,9 +31,9 @@ from ..core.version import CLIENT_VERSION
 class CanonicalStore(GitHubStore):
     """Extended GitHub store with canonicalization and aliasing support."""
     
-    def __init__(self, token: str, repo: str, config_path: Path | None = None):
+    def __init__(self, token: str, repo: str, config_path: Path | None = None, config: DictConfig | None = None):
         """Initialize with GitHub credentials."""
-        super().__init__(token, repo, config_path)
+        super().__init__(repo=repo, token=token, config_path=config_path, config=config)
         self._ensure_special_labels()
     
     def _ensure_special_labels(self) -> None:
@@ -308,7 +309,7 @@ class CanonicalStore(GitHubStore):
         result = base.copy()
         
         for key, value in update.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+            if isinstance(value, dict) and isinstance(result.get(key), dict):
                 result[key] = self._deep_merge(result[key], value)
             else:
                 result[key] = value
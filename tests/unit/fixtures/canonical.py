@@ -2,16 +2,21 @@
 """Fixtures for canonicalization tests"""
 
 import json
-from datetime import datetime, timezone
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 
+from gh_store.cli import commands
+from gh_store.core import store as store_module
 from gh_store.tools.canonicalize import CanonicalStore, LabelNames
+from tests.unit.fixtures.github import DEFAULT_CREATED_AT
+
+# Issue body for mock_issue_with_initial_state, serialized once at import
+INITIAL_STATE_BODY_JSON = json.dumps({"name": "test", "value": 42})
 
 @pytest.fixture
 def mock_canonical_store():
     """Create a mock for CanonicalStore class."""
-    with patch('gh_store.cli.commands.CanonicalStore') as mock_canonical:
+    with patch.object(commands, 'CanonicalStore') as mock_canonical:
         canonical_instance = Mock()
         mock_canonical.return_value = canonical_instance
         
@@ -21,14 +26,14 @@ def mock_canonical_store():
         yield mock_canonical
 
 @pytest.fixture
-def mock_labels_response():
+def mock_labels_response(mock_label_factory):
     """Mock the response for get_labels to return iterable labels."""
-    labels = [
-        Mock(name="stored-object"),
-        Mock(name="deprecated-object"),
-        Mock(name="UID:test-123")
+    # Mock(name=...) only sets the mock's repr, so build real label stand-ins
+    return [
+        mock_label_factory("stored-object"),
+        mock_label_factory("deprecated-object"),
+        mock_label_factory("UID:test-123")
     ]
-    return labels
 
 @pytest.fixture
 def canonical_store_with_mocks(mock_repo_factory, default_config, mock_labels_response):
@@ -45,18 +50,17 @@ def canonical_store_with_mocks(mock_repo_factory, default_config, mock_labels_re
     repo.get_labels.return_value = mock_labels_response
     
     # Create CanonicalStore with mocked repo
-    with patch('gh_store.core.store.Github') as mock_gh:
+    with patch.object(store_module, 'Github') as mock_gh:
         mock_gh.return_value.get_repo.return_value = repo
         
-        store = CanonicalStore(token="fake-token", repo="owner/repo")
+        store = CanonicalStore(token="fake-token", repo="owner/repo", config=default_config)
         store.repo = repo
         store.access_control.repo = repo
-        store.config = default_config
         
         # Mock common methods
         store._extract_comment_metadata = Mock(side_effect=lambda comment, issue_number, object_id: {
             "data": json.loads(comment.body) if hasattr(comment, 'body') else {},
-            "timestamp": getattr(comment, 'created_at', datetime.now(timezone.utc)),
+            "timestamp": getattr(comment, 'created_at', DEFAULT_CREATED_AT),
             "id": getattr(comment, 'id', 1),
             "source_issue": issue_number,
             "source_object_id": object_id
@@ -86,13 +90,13 @@ def mock_issue_with_initial_state(mock_issue_factory, mock_comment_factory):
             }
         },
         comment_id=1,
-        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc)
+        created_at=DEFAULT_CREATED_AT
     )
     
     # Create issue with initial state comment
     return mock_issue_factory(
         number=123,
-        body=json.dumps({"name": "test", "value": 42}),
+        body=INITIAL_STATE_BODY_JSON,
         labels=["stored-object", "UID:metrics"],
         comments=[initial_comment]
     )
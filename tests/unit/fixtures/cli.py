@@ -1,117 +1,89 @@
 # tests/unit/fixtures/cli.py
 """CLI-specific fixtures for gh-store unit tests."""
 
-import os
-import sys
 import logging
-from pathlib import Path
+from types import SimpleNamespace
 from datetime import datetime, timedelta, timezone
-import json
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from loguru import logger
 
 from gh_store.__main__ import CLI
-
-@pytest.fixture(autouse=True)
-def cli_env_vars(monkeypatch):
-    """Setup environment variables for CLI testing."""
-    monkeypatch.setenv('GITHUB_TOKEN', 'test-token')
-    monkeypatch.setenv('GITHUB_REPOSITORY', 'owner/repo')
-    yield
+from gh_store.cli import commands
+from gh_store.core import store as store_module
+from gh_store.core.types import ObjectMeta, StoredObject
+from tests.unit.fixtures.github import DEFAULT_CREATED_AT, DEFAULT_UPDATED_AT
+
+# Wall-clock time seen by CLI commands under the frozen_clock fixture
+FROZEN_NOW = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+# Payloads of the mock_stored_objects entries, shared read-only across tests
+STORED_OBJECT_DATA = (
+    *({"name": f"test{i}", "value": i * 42} for i in range(1, 3)),
+    # Values JSON backends are prone to write differently
+    {"name": "café ☕", "ratio": 1e16, "small": 1.5e-05, "count": 12345678901234567890123},
+)
+
+@pytest.fixture(autouse=True, scope="session")
+def cli_env_vars():
+    """
+    Setup environment variables for CLI testing.
+    
+    os.environ is process-global, which stays safe under pytest-xdist because
+    each worker is a separate process with its own session. The function-scoped
+    monkeypatch fixture can't back a session fixture, so hold our own context.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('GITHUB_TOKEN', 'test-token')
+        mp.setenv('GITHUB_REPOSITORY', 'owner/repo')
+        yield
 
 @pytest.fixture
-def mock_config(tmp_path):
-    """Create a mock config file for testing."""
-    config_dir = tmp_path / ".config" / "gh-store"
-    config_dir.mkdir(parents=True)
-    config_path = config_dir / "config.yml"
-    
-    # Create default config
-    default_config = """
-store:
-  base_label: "stored-object"
-  uid_prefix: "UID:"
-  reactions:
-    processed: "+1"
-    initial_state: "rocket"
-  retries:
-    max_attempts: 3
-    backoff_factor: 2
-  rate_limit:
-    max_requests_per_hour: 1000
-  log:
-    level: "INFO"
-    format: "{time} | {level} | {message}"
-"""
-    config_path.write_text(default_config)
-    return config_path
+def frozen_clock(mock_cli):
+    """Freeze the clock the CLI uses to stamp snapshots."""
+    mock_cli._now = lambda: FROZEN_NOW
+    return FROZEN_NOW
 
 @pytest.fixture
-def mock_gh_repo():
+def mock_gh_repo(monkeypatch):
     """Create a mocked GitHub repo for testing."""
+    # Setup mock repo
     mock_repo = Mock()
-    with patch('gh_store.core.store.Github') as MockGithub:
-        # Setup mock repo
-        mock_repo = Mock()
-        mock_repo.get_issue.return_value = Mock(state="closed")
-        mock_repo.get_issues.return_value = []
-        mock_repo.owner = Mock(login="owner", type="User")
-        
-        # Set up mock Github client
-        MockGithub.return_value.get_repo.return_value = mock_repo
-        yield mock_repo
-
-
-class InterceptHandler(logging.Handler):
-    def emit(self, record):
-        # Try to find caller's module path
-        try:
-            frame = logging.currentframe()
-            depth = 6  # Adjust if needed to find the correct caller
-            while frame and depth > 0:
-                frame = frame.f_back
-                depth -= 1
-            module_path = frame.f_code.co_filename if frame else ""
-            function_name = frame.f_code.co_name if frame else ""
-        except (AttributeError, ValueError):
-            module_path = ""
-            function_name = ""
-
-        # Safely format the message
-        try:
-            msg = self.format(record)
-        except Exception:
-            msg = record.getMessage()
-
-        # Write directly to caplog's handler instead of going through loguru
-        logging.getLogger(record.name).handle(
-            logging.LogRecord(
-                name=record.name,
-                level=record.levelno,
-                pathname=module_path,
-                lineno=record.lineno,
-                msg=msg,
-                args=(),
-                exc_info=record.exc_info,
-                func=function_name
-            )
-        )
+    mock_repo.get_issue.return_value = SimpleNamespace(state="closed")
+    mock_repo.get_issues.return_value = []
+    mock_repo.owner = SimpleNamespace(login="owner", type="User")
+    
+    # Set up mock Github client
+    MockGithub = Mock()
+    MockGithub.return_value.get_repo.return_value = mock_repo
+    monkeypatch.setattr(store_module, 'Github', MockGithub)
+    return mock_repo
 
 # tests/unit/fixtures/cli.py - Update logging setup
 
-@pytest.fixture(autouse=True)
-def setup_loguru(caplog):
-    """Configure loguru for testing with pytest caplog."""
+@pytest.fixture(autouse=True, scope="session")
+def setup_loguru():
+    """
+    Configure loguru for testing with pytest caplog.
+    
+    Loguru messages are forwarded to the stdlib root logger, where each
+    test's caplog handler picks them up, so the sink is installed once per
+    session. Swapping loguru's global sinks is safe under pytest-xdist's
+    worker processes, but not under thread-based runners.
+    """
     # Remove any existing handlers
     logger.remove()
     
-    # Set up caplog
-    caplog.set_level(logging.INFO)
+    # Let INFO records through to caplog
+    root = logging.getLogger()
+    previous_level = root.level
+    root.setLevel(logging.INFO)
     
     # Add a test handler that writes directly to caplog
+    # Keep loguru's level so tests can assert on record.levelname
     def log_to_caplog(message):
-        logging.getLogger().info(message)
+        record = message.record
+        root.log(record["level"].no, record["message"])
     
     handler_id = logger.add(log_to_caplog, format="{message}")
     
@@ -119,49 +91,68 @@ def setup_loguru(caplog):
     
     # Cleanup
     logger.remove(handler_id)
+    root.setLevel(previous_level)
 
 @pytest.fixture
-def mock_cli(mock_config, mock_gh_repo):
+def mock_cli(mock_gh_repo):
     """Create a CLI instance with mocked dependencies."""
-    with patch('gh_store.cli.commands.ensure_config_exists') as mock_ensure:  # Updated path
-        cli = CLI()
-        # Mock HOME to point to our test config
-        with patch.dict(os.environ, {'HOME': str(mock_config.parent.parent.parent)}):
-            yield cli
+    # Function-scoped so the Github patch is undone after each test
+    return CLI()
+
+@pytest.fixture
+def fresh_cli():
+    """Build an unpatched CLI for tests that exercise its real config handling."""
+    return CLI()
+
+@pytest.fixture(scope="class")
+def mock_get_store():
+    """Patch the CLI's store factory once per test class."""
+    mock_get_store = Mock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(commands, 'get_store', mock_get_store)
+        yield mock_get_store
 
 @pytest.fixture
+def mock_store(mock_get_store):
+    """Fresh store mock handed out by the patched get_store for each test."""
+    mock_get_store.reset_mock()
+    mock_get_store.return_value = Mock()
+    return mock_get_store.return_value
+
+@pytest.fixture(scope="session")
 def mock_store_response():
-    """Mock common GitHubStore responses."""
-    mock_obj = Mock()
-    mock_obj.meta = Mock(
-        object_id="test-123",
-        issue_number=42,  # Added issue_number field
-        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
-        updated_at=datetime(2025, 1, 2, tzinfo=timezone.utc),
-        version=1
+    """Mock common GitHubStore responses, shared read-only across tests."""
+    return StoredObject(
+        meta=ObjectMeta(
+            object_id="test-123",
+            label="test-123",
+            issue_number=42,  # Added issue_number field
+            created_at=DEFAULT_CREATED_AT,
+            updated_at=DEFAULT_UPDATED_AT,
+            version=1
+        ),
+        data={"name": "test", "value": 42}
     )
-    mock_obj.data = {"name": "test", "value": 42}
-    return mock_obj
 
 @pytest.fixture
 def mock_stored_objects():
     """Create mock stored objects for testing."""
-    objects = []
-    for i in range(1, 3):
-        mock_obj = Mock()
-        mock_obj.meta = Mock(
-            object_id=f"test-obj-{i}",
-            issue_number=100 + i,  # Added issue_number field
-            created_at=datetime(2025, 1, i, tzinfo=timezone.utc),
-            updated_at=datetime(2025, 1, i+1, tzinfo=timezone.utc),
-            version=1
+    # The real dataclasses are cheap to build and nothing asserts on calls to them.
+    # Kept per-test because snapshot tests move meta.updated_at forward.
+    return [
+        StoredObject(
+            meta=ObjectMeta(
+                object_id=f"test-obj-{i}",
+                label=f"test-obj-{i}",
+                issue_number=100 + i,  # Added issue_number field
+                created_at=datetime(2025, 1, i, tzinfo=timezone.utc),
+                updated_at=datetime(2025, 1, i+1, tzinfo=timezone.utc),
+                version=1
+            ),
+            data=data
         )
-        mock_obj.data = {
-            "name": f"test{i}",
-            "value": i * 42
-        }
-        objects.append(mock_obj)
-    return objects
+        for i, data in enumerate(STORED_OBJECT_DATA, start=1)
+    ]
 
 @pytest.fixture
 def mock_snapshot_file_factory(tmp_path, mock_stored_objects):
@@ -171,18 +162,17 @@ def mock_snapshot_file_factory(tmp_path, mock_stored_objects):
         Create a mock snapshot file with configurable timestamp and objects.
         
         Args:
-            snapshot_time: Custom snapshot timestamp (defaults to 1 day ago)
+            snapshot_time: Custom snapshot timestamp (defaults to 1 day before FROZEN_NOW)
             include_objects: List of indices from mock_stored_objects to include
                             (defaults to all objects)
         
         Returns:
             Path to the created snapshot file
         """
-        # Default timestamp is 1 day ago
         if snapshot_time is None:
-            snapshot_time = datetime.now(timezone.utc) - timedelta(days=1)
+            snapshot_time = FROZEN_NOW - timedelta(days=1)
         
-        snapshot_path = tmp_path / f"snapshot_{int(datetime.now().timestamp())}.json"
+        snapshot_path = tmp_path / f"snapshot_{int(snapshot_time.timestamp())}.json"
         
         # Convert objects to serializable format
         snapshot_data = {
@@ -210,7 +200,7 @@ def mock_snapshot_file_factory(tmp_path, mock_stored_objects):
                 }
             }
         
-        snapshot_path.write_text(json.dumps(snapshot_data, indent=2))
+        snapshot_path.write_bytes(commands._dump_json(snapshot_data))
         return snapshot_path
     
     return _create_snapshot
@@ -2,7 +2,7 @@
 """Fixtures for mocking CommentHandler functionality across tests."""
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from typing import List, Callable
 
 from gh_store.handlers.comment import CommentHandler
@@ -1,12 +1,15 @@
 # tests/unit/fixtures/config.py
 """Configuration fixtures for gh-store unit tests."""
 
+import importlib.resources
 from datetime import datetime, timezone
 from pathlib import Path
 import pytest
-from unittest.mock import patch, mock_open
+from unittest.mock import Mock
 from omegaconf import OmegaConf
 
+from gh_store.core.store import _load_config, _load_default_config
+
 @pytest.fixture
 def default_config():
     """Create a consistent default config for testing."""
@@ -32,22 +35,33 @@ def default_config():
         }
     })
 
+@pytest.fixture(scope="session")
+def default_config_bytes() -> bytes:
+    """Raw bytes of the packaged default config, read once per session."""
+    return importlib.resources.files('gh_store').joinpath('default_config.yml').read_bytes()
+
 @pytest.fixture(autouse=True)
-def mock_config_file(default_config):
+def mock_config_file(default_config, monkeypatch):
     """Mock OmegaConf config loading."""
-    with patch('omegaconf.OmegaConf.load', return_value=default_config) as mock_load:
-        yield mock_load
+    # Drop parsed configs memoized by earlier tests so each test sees its own mock
+    _load_config.cache_clear()
+    _load_default_config.cache_clear()
+    mock_load = Mock(return_value=default_config)
+    monkeypatch.setattr(OmegaConf, 'load', mock_load)
+    yield mock_load
+    _load_config.cache_clear()
+    _load_default_config.cache_clear()
 
-@pytest.fixture
-def test_config_dir(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def test_config_dir(tmp_path_factory) -> Path:
     """Provide a temporary directory for config files during testing."""
-    config_dir = tmp_path / ".config" / "gh-store"
+    config_dir = tmp_path_factory.mktemp("config-home") / ".config" / "gh-store"
     config_dir.mkdir(parents=True)
     return config_dir
 
-@pytest.fixture
-def test_config_file(test_config_dir: Path, default_config: OmegaConf) -> Path:
-    """Create a test config file with minimal valid content."""
+@pytest.fixture(scope="session")
+def test_config_file(test_config_dir: Path, default_config_bytes: bytes) -> Path:
+    """Write the packaged default config once and share its path across tests."""
     config_path = test_config_dir / "config.yml"
-    config_path.write_text(OmegaConf.to_yaml(default_config))
+    config_path.write_bytes(default_config_bytes)
     return config_path
@@ -2,40 +2,101 @@
 """GitHub API mocks for gh-store unit tests."""
 
 from datetime import datetime, timezone
+from functools import lru_cache
+from types import SimpleNamespace
 import json
-from typing import Any, Callable, Literal, TypedDict
+from typing import Any, Callable, Literal, Sequence, TypedDict
 import pytest
 from unittest.mock import Mock, patch
 from github import GithubException
+from github.Issue import Issue
+from github.IssueComment import IssueComment
+from github.Repository import Repository
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from gh_store.core import store as store_module
 from gh_store.core.constants import LabelNames
 
-@pytest.fixture
+def dump_body(obj: Any) -> str:
+    """Serialize a mock issue/comment body to JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+class LabelSet:
+    """
+    Matcher for a labels argument that ignores order.
+    
+    GitHub filters issues by label regardless of the order labels are listed
+    in, so assertions on label queries shouldn't depend on it either.
+    """
+    def __init__(self, *labels: str):
+        self.labels = frozenset(labels)
+    
+    def __eq__(self, other) -> bool:
+        # The length check rejects queries that repeat a label
+        if not isinstance(other, (list, tuple, set, frozenset)):
+            return NotImplemented
+        return len(other) == len(self.labels) and set(other) == self.labels
+    
+    def __repr__(self) -> str:
+        return f"LabelSet({', '.join(sorted(map(repr, self.labels)))})"
+
+# Default timestamps for mock issues and comments
+DEFAULT_CREATED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+DEFAULT_UPDATED_AT = datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+# Emoji keys GitHub includes in every comment's reaction summary
+REACTION_CONTENTS = ("+1", "-1", "laugh", "hooray", "confused", "heart", "rocket", "eyes")
+
+# Attribute names of the real PyGithub classes; spec'd mocks reject any other
+# attribute, so a typo or a renamed PyGithub attribute fails loudly
+_ISSUE_SPEC = dir(Issue)
+_COMMENT_SPEC = dir(IssueComment)
+_REPO_SPEC = dir(Repository)
+
+@lru_cache(maxsize=None)
+def _pooled_label(name: str, color: str = "0366d6", description: str = None) -> SimpleNamespace:
+    """
+    Create a mock label with GitHub-like structure.
+    
+    Labels are never mutated by the code under test, so a single mock is
+    shared per (name, color, description) across the whole session.
+    
+    Args:
+        name: Name of the label
+        color: Color hex code without #
+        description: Optional description for the label
+    """
+    return SimpleNamespace(name=name, color=color, description=description)
+
+@lru_cache(maxsize=None)
+def _pooled_user(login: str) -> SimpleNamespace:
+    """Shared author stub for issues and comments; like labels, never mutated."""
+    return SimpleNamespace(login=login)
+
+@lru_cache(maxsize=None)
+def _pooled_repository(owner_login: str) -> SimpleNamespace:
+    """Shared issue.repository stub owned by the given user."""
+    return SimpleNamespace(owner=SimpleNamespace(login=owner_login, type="User"))
+
+@pytest.fixture(scope="session")
 def mock_label_factory():
     """
     Create GitHub-style label objects.
     
+    Repeated names return the same pooled label mock.
+    
     Example:
         label = mock_label_factory("enhancement")
         label = mock_label_factory("bug", "fc2929")
         label = mock_label_factory("bug", "fc2929", "Bug description")
     """
-    def create_label(name: str, color: str = "0366d6", description: str = None) -> Mock:
-        """
-        Create a mock label with GitHub-like structure.
-        
-        Args:
-            name: Name of the label
-            color: Color hex code without #
-            description: Optional description for the label
-        """
-        label = Mock()
-        label.name = name
-        label.color = color
-        label.description = description
-        return label
-    
-    return create_label
+    return _pooled_label
 
 class CommentMetadata(TypedDict, total=False):
     """Metadata for comment creation."""
@@ -49,7 +110,7 @@ class CommentBody(TypedDict, total=False):
     _meta: CommentMetadata
     type: Literal['initial_state'] | None
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_comment_factory():
     """
     Create GitHub comment mocks with standard structure.
@@ -119,17 +180,15 @@ def mock_comment_factory():
             if "type" in body and body["type"] not in [None, "initial_state"]:
                 raise ValueError("type must be None or 'initial_state'")
 
-        comment = Mock()
+        comment = Mock(spec=_COMMENT_SPEC)
         
         # Set basic attributes
         comment.id = comment_id or 1
-        comment.body = json.dumps(body)
-        comment.created_at = created_at or datetime(2025, 1, 1, tzinfo=timezone.utc)
+        comment.body = dump_body(body)
+        comment.created_at = created_at or DEFAULT_CREATED_AT
         
         # Set up user
-        user = Mock()
-        user.login = user_login
-        comment.user = user
+        comment.user = _pooled_user(user_login)
         
         # Set up reactions with validation
         mock_reactions = []
@@ -140,11 +199,15 @@ def mock_comment_factory():
                         raise ValueError("Mock reaction must have 'content' attribute")
                     mock_reactions.append(reaction)
                 else:
-                    mock_reaction = Mock()
-                    mock_reaction.content = str(reaction)
-                    mock_reactions.append(mock_reaction)
+                    mock_reactions.append(SimpleNamespace(content=str(reaction)))
         
         comment.get_reactions = Mock(return_value=mock_reactions)
+        
+        # Mirror the reaction summary GitHub returns alongside listed comments
+        summary = dict.fromkeys(REACTION_CONTENTS, 0)
+        for reaction in mock_reactions:
+            summary[reaction.content] = summary.get(reaction.content, 0) + 1
+        comment.reactions = {**summary, "total_count": len(mock_reactions)}
         comment.create_reaction = Mock()
         
         # Add any additional attributes
@@ -159,7 +222,7 @@ def mock_comment_factory():
 mock_comment = mock_comment_factory
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_issue_factory(mock_comment_factory, mock_label_factory):
     """
     Create GitHub issue mocks with standard structure.
@@ -189,7 +252,7 @@ def mock_issue_factory(mock_comment_factory, mock_label_factory):
     def create_issue(
         number: int | None = None,
         body: dict[str, Any] | str | None = None,
-        labels: list[str] | None = None,
+        labels: Sequence[str | SimpleNamespace] | None = None,
         comments: list[Mock] | None = None,
         state: str = "closed",
         user_login: str = "repo-owner",
@@ -203,7 +266,7 @@ def mock_issue_factory(mock_comment_factory, mock_label_factory):
         Args:
             number: Issue number (defaults to 1 if not provided)
             body: Issue body content (dict will be JSON serialized)
-            labels: List of label names to add
+            labels: Label names or prebuilt label objects to add
             comments: List of mock comments
             state: Issue state (open/closed)
             user_login: GitHub username of issue creator
@@ -211,28 +274,24 @@ def mock_issue_factory(mock_comment_factory, mock_label_factory):
             updated_at: Issue last update timestamp
             **kwargs: Additional attributes to set
         """
-        issue = Mock()
+        issue = Mock(spec=_ISSUE_SPEC)
         
         # Set basic attributes
         issue.number = number or 1  # Default to 1 if not provided
-        issue.body = json.dumps(body) if isinstance(body, dict) else (body or "{}")
+        issue.body = dump_body(body) if isinstance(body, dict) else (body or "{}")
         issue.state = state
-        issue.created_at = created_at or datetime(2025, 1, 1, tzinfo=timezone.utc)
-        issue.updated_at = updated_at or datetime(2025, 1, 2, tzinfo=timezone.utc)
+        issue.created_at = created_at or DEFAULT_CREATED_AT
+        issue.updated_at = updated_at or DEFAULT_UPDATED_AT
         
         # Set up user
-        user = Mock()
-        user.login = user_login
-        issue.user = user
+        issue.user = _pooled_user(user_login)
         
         # Set up labels
-        issue_labels = []
-        issue.labels = issue_labels
-        if labels:
-            for label_name in labels:
-                issue.labels.append(mock_label_factory(label_name))
-                #issue.labels.append(label_name)
-        
+        # Label names are wrapped; prebuilt label objects are used as-is
+        issue.labels = [
+            mock_label_factory(label) if isinstance(label, str) else label
+            for label in labels or []
+        ]
         
         # Set up comments
         mock_comments = list(comments) if comments is not None else []
@@ -240,12 +299,7 @@ def mock_issue_factory(mock_comment_factory, mock_label_factory):
         issue.create_comment = Mock()
 
         # Set up proper owner permissions
-        repo = Mock()
-        owner = Mock()
-        owner.login = user_login
-        owner.type = "User"
-        repo.owner = owner
-        issue.repository = repo  # Needed for access control checks
+        issue.repository = _pooled_repository(user_login)  # Needed for access control checks
         
         # Set up issue editing
         issue.edit = Mock()
@@ -262,7 +316,7 @@ def mock_issue_factory(mock_comment_factory, mock_label_factory):
 mock_issue = mock_issue_factory
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_repo_factory(mock_label_factory):
     """
     Create GitHub repository mocks with standard structure.
@@ -288,16 +342,13 @@ def mock_repo_factory(mock_label_factory):
             issues: Initial repository issues
             **kwargs: Additional attributes to set
         """
-        repo = Mock()
+        repo = Mock(spec=_REPO_SPEC)
         
         # Set basic attributes
         repo.full_name = name
         
         # Set up owner - making it more explicit
-        owner = Mock(spec=['login', 'type'])  # Specify expected attributes
-        owner.login = owner_login
-        owner.type = owner_type
-        repo.owner = owner
+        repo.owner = SimpleNamespace(login=owner_login, type=owner_type)
         
         # Set up labels - include gh-store by default unless specified otherwise
         repo_labels = []
@@ -321,7 +372,7 @@ def mock_repo_factory(mock_label_factory):
             matching = [i for i in repo_issues if i.number == number]
             if matching:
                 return matching[0]
-            mock_issue = Mock()
+            mock_issue = Mock(spec=_ISSUE_SPEC)
             mock_issue.state = "closed"
             return mock_issue
         repo.get_issue = Mock(side_effect=get_issue)
@@ -330,9 +381,7 @@ def mock_repo_factory(mock_label_factory):
         # Set up CODEOWNERS handling
         def get_contents(path: str) -> Mock:
             if path in ['.github/CODEOWNERS', 'docs/CODEOWNERS', 'CODEOWNERS']:
-                content = Mock()
-                content.decoded_content = f"* @{owner_login}".encode()
-                return content
+                return SimpleNamespace(decoded_content=f"* @{owner_login}".encode())
             raise GithubException(404, "Not found")
         repo.get_contents = Mock(side_effect=get_contents)
         
@@ -347,29 +396,27 @@ def mock_repo_factory(mock_label_factory):
 @pytest.fixture
 def mock_github():
     """Create a mock Github instance with proper repository structure."""
-    with patch('gh_store.core.store.Github') as mock_gh:
+    # Tests reassign repo attributes freely, so this stays function-scoped;
+    # a plain Mock skips the magic-method setup MagicMock would do each time
+    with patch.object(store_module, 'Github', new_callable=Mock) as mock_gh:
         # Setup mock repo
-        mock_repo = Mock()
+        mock_repo = Mock(spec=_REPO_SPEC)
         
         # Setup owner
-        owner = Mock()
-        owner.login = "repo-owner"
-        owner.type = "User"
-        mock_repo.owner = owner
+        mock_repo.owner = SimpleNamespace(login="repo-owner", type="User")
         
         # Setup labels
-        mock_labels = [Mock(name=LabelNames.STORED_OBJECT.value), Mock(name=LabelNames.GH_STORE.value)]
+        mock_labels = [_pooled_label(LabelNames.STORED_OBJECT.value), _pooled_label(LabelNames.GH_STORE.value)]
         mock_repo.get_labels = Mock(return_value=mock_labels)
         
         def create_label(name: str, color: str = "0366d6") -> Mock:
-            new_label = Mock(name=name)
+            new_label = _pooled_label(name, color)
             mock_labels.append(new_label)
             return new_label
         mock_repo.create_label = Mock(side_effect=create_label)
         
         # Mock CODEOWNERS access
-        mock_content = Mock()
-        mock_content.decoded_content = b"* @repo-owner"
+        mock_content = SimpleNamespace(decoded_content=b"* @repo-owner")
         def get_contents_side_effect(path: str) -> Mock:
             if path in ['.github/CODEOWNERS', 'docs/CODEOWNERS', 'CODEOWNERS']:
                 return mock_content
@@ -2,15 +2,19 @@
 """Store-related fixtures for gh-store unit tests."""
 
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from typing import Sequence
 from unittest.mock import Mock, patch
 
 import pytest
 
+from gh_store.core import store as store_module
+from gh_store.handlers import issue as issue_module
 from gh_store.core.constants import LabelNames
 from gh_store.core.exceptions import ObjectNotFound
 from gh_store.core.store import GitHubStore
 from gh_store.core.version import CLIENT_VERSION
+from tests.unit.fixtures.github import DEFAULT_CREATED_AT, DEFAULT_UPDATED_AT
 
 
 def setup_mock_auth(store, authorized_users: Sequence[str] | None = None):
@@ -33,14 +37,21 @@ def setup_mock_auth(store, authorized_users: Sequence[str] | None = None):
     if len(authorized_users) > 1:
         # Mock CODEOWNERS content
         codeowners_content = "* " + " ".join(f"@{user}" for user in authorized_users)
-        mock_content = Mock()
-        mock_content.decoded_content = codeowners_content.encode()
+        mock_content = SimpleNamespace(decoded_content=codeowners_content.encode())
         store.repo.get_contents = Mock(return_value=mock_content)
         
         # Clear codeowners cache to force reload
         store.access_control._codeowners = None
 
 
+@pytest.fixture(scope="session", autouse=True)
+def no_retry_sleep():
+    """Skip the real backoff sleeps in retried GitHub calls."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(issue_module, "sleep", lambda seconds: None)
+        yield
+
+
 @pytest.fixture
 def store(mock_repo_factory, default_config):
     """Create GitHubStore instance with mocked dependencies."""
@@ -51,13 +62,13 @@ def store(mock_repo_factory, default_config):
         labels=[LabelNames.GH_STORE.value, LabelNames.STORED_OBJECT.value]
     )
     
-    with patch('gh_store.core.store.Github') as mock_gh:
-        mock_gh.return_value.get_repo.return_value = repo
-        
-        store = GitHubStore(token="fake-token", repo="owner/repo")
+    # A plain stand-in client is enough here: no test inspects the Github
+    # constructor, and it avoids building a MagicMock tree per test
+    client = SimpleNamespace(get_repo=lambda name: repo)
+    with patch.object(store_module, 'Github', lambda token, per_page: client):
+        store = GitHubStore(token="fake-token", repo="owner/repo", config=default_config)
         store.repo = repo
         store.access_control.repo = repo
-        store.config = default_config
         
         # Set up default authorization
         setup_mock_auth(store)
@@ -92,7 +103,7 @@ def history_mock_comments(mock_comment):
             }
         },
         comment_id=1,
-        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc)
+        created_at=DEFAULT_CREATED_AT
     ))
     
     # First update
@@ -108,7 +119,7 @@ def history_mock_comments(mock_comment):
             }
         },
         comment_id=2,
-        created_at=datetime(2025, 1, 2, tzinfo=timezone.utc)
+        created_at=DEFAULT_UPDATED_AT
     ))
     
     # Second update
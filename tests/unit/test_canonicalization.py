@@ -3,15 +3,38 @@
 
 import json
 from datetime import datetime, timezone
+from types import SimpleNamespace
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
+from gh_store.core import store as store_module
 from gh_store.core.constants import LabelNames
 from gh_store.tools.canonicalize import CanonicalStore, DeprecationReason
+from tests.unit.fixtures.github import DEFAULT_CREATED_AT, DEFAULT_UPDATED_AT, LabelSet
+
+# UID labels shared by the metrics alias scenarios
+UID_METRICS = f"{LabelNames.UID_PREFIX}metrics"
+UID_OLD_METRICS = f"{LabelNames.UID_PREFIX}old-metrics"
+
+# Issue bodies for the fixtures below, serialized once at import
+ALIAS_BODY_JSON = json.dumps({"period": "daily"})
+CANONICAL_BODY_JSON = json.dumps({"count": 42})
+DUPLICATE_BODY_JSON = json.dumps({"count": 15})
+DEPRECATED_BODY_JSON = json.dumps({"old": "data"})
+
+# Timestamps shared between the fixtures and the history entries built from them
+DUPLICATE_CREATED_AT = datetime(2025, 1, 5, tzinfo=timezone.utc)
+ALIAS_CREATED_AT = datetime(2025, 1, 10, tzinfo=timezone.utc)
+CANONICAL_UPDATED_AT = datetime(2025, 1, 15, tzinfo=timezone.utc)
+
+
+def assert_label_query(get_issues, *labels):
+    """Assert the last issue lookup queried exactly these labels across all states."""
+    get_issues.assert_called_with(labels=LabelSet(*labels), state="all")
 
 
 @pytest.fixture
-def canonical_store(store, mock_repo_factory, default_config):
+def canonical_store(store, mock_repo_factory, default_config, mocker):
     """Create a CanonicalStore with mocked dependencies."""
     repo = mock_repo_factory(
         name="owner/repo",
@@ -20,18 +43,17 @@ def canonical_store(store, mock_repo_factory, default_config):
         labels=["stored-object"]
     )
     
-    with patch('gh_store.core.store.Github') as mock_gh:
-        mock_gh.return_value.get_repo.return_value = repo
-        
-        store = CanonicalStore(token="fake-token", repo="owner/repo")
-        store.repo = repo
-        store.access_control.repo = repo
-        store.config = default_config
-        
-        # Mock the _ensure_special_labels method to avoid API calls
-        store._ensure_special_labels = Mock()
-        
-        return store
+    mock_gh = mocker.patch.object(store_module, 'Github')
+    mock_gh.return_value.get_repo.return_value = repo
+    
+    store = CanonicalStore(token="fake-token", repo="owner/repo", config=default_config)
+    store.repo = repo
+    store.access_control.repo = repo
+    
+    # Mock the _ensure_special_labels method to avoid API calls
+    store._ensure_special_labels = mocker.Mock()
+    
+    return store
 
 @pytest.fixture
 def mock_alias_issue(mock_issue_factory):
@@ -43,8 +65,8 @@ def mock_alias_issue(mock_issue_factory):
             f"{LabelNames.UID_PREFIX}daily-metrics",
             f"{LabelNames.ALIAS_TO_PREFIX}metrics"
         ],
-        body=json.dumps({"period": "daily"}),
-        created_at=datetime(2025, 1, 10, tzinfo=timezone.utc),
+        body=ALIAS_BODY_JSON,
+        created_at=ALIAS_CREATED_AT,
         updated_at=datetime(2025, 1, 12, tzinfo=timezone.utc)
     )
 
@@ -55,11 +77,11 @@ def mock_canonical_issue(mock_issue_factory):
         number=123,
         labels=[
             LabelNames.STORED_OBJECT,
-            f"{LabelNames.UID_PREFIX}metrics"
+            UID_METRICS
         ],
-        body=json.dumps({"count": 42}),
-        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
-        updated_at=datetime(2025, 1, 15, tzinfo=timezone.utc)
+        body=CANONICAL_BODY_JSON,
+        created_at=DEFAULT_CREATED_AT,
+        updated_at=CANONICAL_UPDATED_AT
     )
 
 @pytest.fixture
@@ -69,11 +91,11 @@ def mock_duplicate_issue(mock_issue_factory, mock_label_factory):
         number=456,
         labels=[
             mock_label_factory(LabelNames.STORED_OBJECT),
-            mock_label_factory(f"{LabelNames.UID_PREFIX}metrics")
+            mock_label_factory(UID_METRICS)
         ],
-        body=json.dumps({"count": 15}),
-        created_at=datetime(2025, 1, 5, tzinfo=timezone.utc),
-        updated_at=datetime(2025, 1, 5, tzinfo=timezone.utc)
+        body=DUPLICATE_BODY_JSON,
+        created_at=DUPLICATE_CREATED_AT,
+        updated_at=DUPLICATE_CREATED_AT
     )
 
 @pytest.fixture
@@ -85,7 +107,7 @@ def mock_deprecated_issue(mock_issue_factory, mock_label_factory):
             mock_label_factory(LabelNames.DEPRECATED),
             mock_label_factory(f"{LabelNames.MERGED_INTO_PREFIX}metrics")
         ],
-        body=json.dumps({"old": "data"}),
+        body=DEPRECATED_BODY_JSON,
         created_at=datetime(2025, 1, 6, tzinfo=timezone.utc),
         updated_at=datetime(2025, 1, 6, tzinfo=timezone.utc)
     )
@@ -103,9 +125,10 @@ class TestCanonicalStoreObjectResolution:
         assert result == "metrics"
         
         # Verify correct query was made - using string labels as the real implementation does
-        canonical_store.repo.get_issues.assert_called_with(
-            labels=[f"{LabelNames.UID_PREFIX}metrics", f"{LabelNames.ALIAS_TO_PREFIX}*"],
-            state="all"
+        assert_label_query(
+            canonical_store.repo.get_issues,
+            UID_METRICS,
+            f"{LabelNames.ALIAS_TO_PREFIX}*"
         )
         
     def test_resolve_canonical_object_id_alias(self, canonical_store, mock_alias_issue):
@@ -128,25 +151,26 @@ class TestCanonicalStoreObjectResolution:
 
     def test_resolve_canonical_object_id_circular_prevention(self, canonical_store, mock_label_factory):
         """Test prevention of circular references in alias resolution."""
+        uid_a = f"{LabelNames.UID_PREFIX}object-a"
+        uid_b = f"{LabelNames.UID_PREFIX}object-b"
+        
         # Create a circular reference scenario
-        circular_alias_1 = Mock()
-        circular_alias_1.labels = [
-            mock_label_factory(f"{LabelNames.UID_PREFIX}object-a"),
+        circular_alias_1 = SimpleNamespace(labels=[
+            mock_label_factory(uid_a),
             mock_label_factory(f"{LabelNames.ALIAS_TO_PREFIX}object-b")
-        ]
+        ])
         
-        circular_alias_2 = Mock()
-        circular_alias_2.labels = [
-            mock_label_factory(f"{LabelNames.UID_PREFIX}object-b"),
+        circular_alias_2 = SimpleNamespace(labels=[
+            mock_label_factory(uid_b),
             mock_label_factory(f"{LabelNames.ALIAS_TO_PREFIX}object-a")
-        ]
+        ])
         
         # Set up repository to simulate circular references
         def mock_get_issues_side_effect(**kwargs):
             labels = kwargs.get('labels', [])
-            if f"{LabelNames.UID_PREFIX}object-a" in labels:
+            if uid_a in labels:
                 return [circular_alias_1]
-            elif f"{LabelNames.UID_PREFIX}object-b" in labels:
+            elif uid_b in labels:
                 return [circular_alias_2]
             return []
             
@@ -159,34 +183,24 @@ class TestCanonicalStoreObjectResolution:
 class TestCanonicalStoreAliasing:
     """Test alias creation and handling."""
 
-    def test_create_alias(self, canonical_store, mock_canonical_issue, mock_alias_issue, mock_label_factory, mock_issue_factory):
+    def test_create_alias(self, canonical_store, mock_canonical_issue, mock_issue_factory):
         """Test creating an alias relationship."""
-        # Set up repository to find source and target objects
+        uid_source = f"{LabelNames.UID_PREFIX}weekly-metrics"
+        source_issue = mock_issue_factory(
+            number=101,
+            labels=[LabelNames.STORED_OBJECT, uid_source]
+        )
+        
+        # Set up repository to find source and target objects by their UID labels
         def mock_get_issues_side_effect(**kwargs):
             labels = kwargs.get('labels', [])
-            if f"{LabelNames.UID_PREFIX}weekly-metrics" in labels:
-                # Source object
-                return [mock_issue_factory(
-                    number=101,
-                    labels=[
-                        LabelNames.STORED_OBJECT,
-                        f"{LabelNames.UID_PREFIX}weekly-metrics"
-                    ]
-                )]
-            elif f"{LabelNames.UID_PREFIX}metrics" in labels:
-                # Target object
+            if uid_source in labels:
+                return [source_issue]
+            elif UID_METRICS in labels:
                 return [mock_canonical_issue]
             return []
-            
-        canonical_store.repo.get_issues.side_effect = mock_get_issues_side_effect
-        
-        # Mock the add_to_labels method
-        source_issue_mock = Mock()
-        canonical_store.repo.get_issues.return_value = [source_issue_mock]
         
-        # Mock the create_comment method
-        source_issue_mock.create_comment = Mock()
-        mock_canonical_issue.create_comment = Mock()
+        canonical_store.repo.get_issues.side_effect = mock_get_issues_side_effect
         
         # Create label if needed
         canonical_store.repo.create_label = Mock()
@@ -202,14 +216,12 @@ class TestCanonicalStoreAliasing:
         # Verify label was created
         canonical_store.repo.create_label.assert_called_once()
         
-        # Verify label was added to source issue
-        #source_issue_mock.add_to_labels.assert_called_with(f"{LabelNames.ALIAS_TO_PREFIX}metrics")
-        #assert f"{LabelNames.ALIAS_TO_PREFIX}metrics" in source_issue_mock.labels
-        #assert source_issue_mock.labels.append.assert_called_with(f"{LabelNames.ALIAS_TO_PREFIX}metrics")
-        
-        # Verify system comments were added
-        #source_issue_mock.create_comment.assert_called_once()
-        #mock_canonical_issue.create_comment.assert_called_once()
+        # Verify label was added to source issue only
+        source_issue.add_to_labels.assert_called_once_with(f"{LabelNames.ALIAS_TO_PREFIX}metrics")
+        mock_canonical_issue.add_to_labels.assert_not_called()
+        mock_canonical_issue.remove_from_labels.assert_not_called()
+        mock_canonical_issue.create_comment.assert_not_called()
+        mock_canonical_issue.edit.assert_not_called()
 
     def test_create_alias_already_alias(self, canonical_store, mock_alias_issue):
         """Test error when creating an alias for an object that is already an alias."""
@@ -232,9 +244,10 @@ class TestCanonicalStoreAliasing:
     def test_create_alias_target_not_found(self, canonical_store, mock_duplicate_issue):
         """Test error when target object is not found."""
         # Set up repository to find source but not target
+        uid_duplicate = f"{LabelNames.UID_PREFIX}duplicate-metrics"
         def mock_get_issues_side_effect(**kwargs):
             labels = kwargs.get('labels', [])
-            if f"{LabelNames.UID_PREFIX}duplicate-metrics" in labels:
+            if uid_duplicate in labels:
                 return [mock_duplicate_issue]
             return []
             
@@ -255,23 +268,23 @@ class TestCanonicalStoreDeprecation:
         # Create source and target issues
         source_issue = mock_issue_factory(
             number=123,
-            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, "UID:old-metrics"],
-            created_at=datetime(2025, 1, 5, tzinfo=timezone.utc)
+            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, UID_OLD_METRICS],
+            created_at=DUPLICATE_CREATED_AT
         )
         
         target_issue = mock_issue_factory(
             number=456,
-            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, "UID:metrics"],
-            created_at=datetime(2025, 1, 1, tzinfo=timezone.utc)
+            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, UID_METRICS],
+            created_at=DEFAULT_CREATED_AT
         )
         
         # Setup get_issues mock
         def mock_get_issues(**kwargs):
             labels = kwargs.get('labels', [])
             if len(labels) > 0:
-                if "UID:old-metrics" in labels[0]:
+                if UID_OLD_METRICS in labels[0]:
                     return [source_issue]
-                elif "UID:metrics" in labels[0]:
+                elif UID_METRICS in labels[0]:
                     return [target_issue]
             return []
         
@@ -310,8 +323,8 @@ class TestCanonicalStoreDeprecation:
         # Create a test issue
         issue = mock_issue_factory(
             number=123,
-            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, "UID:metrics"],
-            created_at=datetime(2025, 1, 1, tzinfo=timezone.utc)
+            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, UID_METRICS],
+            created_at=DEFAULT_CREATED_AT
         )
         
         # Setup mocks
@@ -330,14 +343,14 @@ class TestCanonicalStoreDeprecation:
         # Create two issues with same UID and stored-object labels
         canonical_issue = mock_issue_factory(
             number=101,
-            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, "UID:metrics"],
-            created_at=datetime(2025, 1, 1, tzinfo=timezone.utc)
+            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, UID_METRICS],
+            created_at=DEFAULT_CREATED_AT
         )
         
         duplicate_issue = mock_issue_factory(
             number=102,
-            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, "UID:metrics"],
-            created_at=datetime(2025, 1, 2, tzinfo=timezone.utc)
+            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, UID_METRICS],
+            created_at=DEFAULT_UPDATED_AT
         )
         
         # Setup mock for get_issues to return our test issues
@@ -390,14 +403,14 @@ class TestCanonicalStoreDeprecation:
         # Create source and target issues
         source_issue = mock_issue_factory(
             number=123,
-            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, "UID:old-metrics"],
-            created_at=datetime(2025, 1, 5, tzinfo=timezone.utc)
+            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, UID_OLD_METRICS],
+            created_at=DUPLICATE_CREATED_AT
         )
         
         target_issue = mock_issue_factory(
             number=456,
-            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, "UID:metrics"],
-            created_at=datetime(2025, 1, 1, tzinfo=timezone.utc)
+            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, UID_METRICS],
+            created_at=DEFAULT_CREATED_AT
         )
         
         # Setup get_issue mock
@@ -483,7 +496,7 @@ class TestCanonicalStoreVirtualMerge:
                     }
                 },
                 comment_id=1,
-                created_at=datetime(2025, 1, 1, tzinfo=timezone.utc)
+                created_at=DEFAULT_CREATED_AT
             ),
             mock_comment_factory(
                 body={
@@ -496,7 +509,7 @@ class TestCanonicalStoreVirtualMerge:
                     }
                 },
                 comment_id=2,
-                created_at=datetime(2025, 1, 2, tzinfo=timezone.utc)
+                created_at=DEFAULT_UPDATED_AT
             )
         ]
         
@@ -512,7 +525,7 @@ class TestCanonicalStoreVirtualMerge:
                     }
                 },
                 comment_id=3,
-                created_at=datetime(2025, 1, 10, tzinfo=timezone.utc)
+                created_at=ALIAS_CREATED_AT
             )
         ]
         
@@ -523,7 +536,7 @@ class TestCanonicalStoreVirtualMerge:
         # Set up repository to find canonical and alias issues
         def mock_get_issues_side_effect(**kwargs):
             labels = kwargs.get('labels', [])
-            if f"{LabelNames.UID_PREFIX}metrics" in labels and f"{LabelNames.ALIAS_TO_PREFIX}*" not in labels:
+            if UID_METRICS in labels and f"{LabelNames.ALIAS_TO_PREFIX}*" not in labels:
                 # When searching for canonical
                 return [mock_canonical_issue]
             elif f"{LabelNames.ALIAS_TO_PREFIX}metrics" in labels:
@@ -584,7 +597,7 @@ class TestCanonicalStoreVirtualMerge:
                         "issue_number": 123  # Include issue number
                     }
                 },
-                "timestamp": datetime(2025, 1, 1, tzinfo=timezone.utc),
+                "timestamp": DEFAULT_CREATED_AT,
                 "id": 1,
                 "source_issue": 123,
                 "source_object_id": "metrics"
@@ -599,7 +612,7 @@ class TestCanonicalStoreVirtualMerge:
                         "issue_number": 123  # Include issue number
                     }
                 },
-                "timestamp": datetime(2025, 1, 2, tzinfo=timezone.utc),
+                "timestamp": DEFAULT_UPDATED_AT,
                 "id": 2,
                 "source_issue": 123,
                 "source_object_id": "metrics"
@@ -614,7 +627,7 @@ class TestCanonicalStoreVirtualMerge:
                         "issue_number": 789  # Different issue number
                     }
                 },
-                "timestamp": datetime(2025, 1, 10, tzinfo=timezone.utc),
+                "timestamp": ALIAS_CREATED_AT,
                 "id": 3,
                 "source_issue": 789,
                 "source_object_id": "daily-metrics"
@@ -629,7 +642,7 @@ class TestCanonicalStoreVirtualMerge:
                         "issue_number": 123  # Include issue number
                     }
                 },
-                "timestamp": datetime(2025, 1, 15, tzinfo=timezone.utc),
+                "timestamp": CANONICAL_UPDATED_AT,
                 "id": 4,
                 "source_issue": 123,
                 "source_object_id": "metrics"
@@ -673,10 +686,10 @@ class TestCanonicalStoreGetUpdate:
         canonical_store.resolve_canonical_object_id = Mock(return_value="metrics")
         
         # Set up process_with_virtual_merge to return a mock object
-        mock_obj = Mock()
-        mock_obj.meta.object_id = "metrics"
-        mock_obj.meta.issue_number = 123  # Set issue number in returned object
-        mock_obj.data = {"count": 42, "name": "test"}
+        mock_obj = SimpleNamespace(
+            meta=SimpleNamespace(object_id="metrics", issue_number=123),
+            data={"count": 42, "name": "test"},
+        )
         canonical_store.process_with_virtual_merge = Mock(return_value=mock_obj)
         
         # Execute get_object
@@ -697,10 +710,10 @@ class TestCanonicalStoreGetUpdate:
         canonical_store.resolve_canonical_object_id = Mock(return_value="metrics")
         
         # Set up process_with_virtual_merge to return a mock object
-        mock_obj = Mock()
-        mock_obj.meta.object_id = "metrics"
-        mock_obj.meta.issue_number = 123  # Set issue number in returned object
-        mock_obj.data = {"count": 42, "name": "test"}
+        mock_obj = SimpleNamespace(
+            meta=SimpleNamespace(object_id="metrics", issue_number=123),
+            data={"count": 42, "name": "test"},
+        )
         canonical_store.process_with_virtual_merge = Mock(return_value=mock_obj)
         
         # Execute get_object with alias ID
@@ -728,10 +741,10 @@ class TestCanonicalStoreGetUpdate:
         mock_alias_issue.edit = Mock()
         
         # Mock get_object to return a result after update
-        mock_obj = Mock()
-        mock_obj.meta.object_id = "metrics"
-        mock_obj.meta.issue_number = 123  # Set issue number in result
-        mock_obj.data = {"count": 42, "name": "test", "period": "daily", "new_field": "value"}
+        mock_obj = SimpleNamespace(
+            meta=SimpleNamespace(object_id="metrics", issue_number=123),
+            data={"count": 42, "name": "test", "period": "daily", "new_field": "value"},
+        )
         canonical_store.get_object = Mock(return_value=mock_obj)
         
         # Execute update_object on the alias
@@ -750,7 +763,7 @@ class TestCanonicalStoreGetUpdate:
         mock_alias_issue.edit.assert_called_with(state="open")
         
         # Verify comment payload included issue number
-        call_args = mock_alias_issue.create_comment.call_args[0]
+        call_args = mock_alias_issue.create_comment.call_args.args
         comment_payload = json.loads(call_args[0])
         assert "issue_number" in comment_payload["_meta"]
         assert comment_payload["_meta"]["issue_number"] == 789  # Should use alias issue number
@@ -766,7 +779,7 @@ class TestCanonicalStoreGetUpdate:
             labels = kwargs.get('labels', [])
             if f"{LabelNames.MERGED_INTO_PREFIX}*" in labels and LabelNames.DEPRECATED in labels:
                 return [mock_deprecated_issue]
-            elif f"{LabelNames.UID_PREFIX}metrics" in labels:
+            elif UID_METRICS in labels:
                 return [mock_canonical_issue]
             return []
             
@@ -783,10 +796,10 @@ class TestCanonicalStoreGetUpdate:
         mock_canonical_issue.edit = Mock()
         
         # Mock get_object to return a result after update
-        mock_obj = Mock()
-        mock_obj.meta.object_id = "metrics"
-        mock_obj.meta.issue_number = 123  # Set issue number
-        mock_obj.data = {"count": 42, "name": "test", "new_field": "value"}
+        mock_obj = SimpleNamespace(
+            meta=SimpleNamespace(object_id="metrics", issue_number=123),
+            data={"count": 42, "name": "test", "new_field": "value"},
+        )
         canonical_store.get_object = Mock(return_value=mock_obj)
         canonical_store.resolve_canonical_object_id = Mock(return_value="metrics")
         
@@ -814,10 +827,10 @@ class TestCanonicalStoreGetUpdate:
         mock_alias_issue.edit = Mock()
         
         # Mock get_object with canonicalize=False to return the alias object
-        alias_obj = Mock()
-        alias_obj.meta.object_id = "daily-metrics"
-        alias_obj.meta.issue_number = 789  # Set alias issue number
-        alias_obj.data = {"period": "daily", "additional": "info"}
+        alias_obj = SimpleNamespace(
+            meta=SimpleNamespace(object_id="daily-metrics", issue_number=789),
+            data={"period": "daily", "additional": "info"},
+        )
         
         canonical_store.get_object = Mock(return_value=alias_obj)
         
@@ -841,12 +854,12 @@ class TestCanonicalStoreFinding:
         # Create issues with same UID
         issue1 = mock_issue_factory(
             number=101,
-            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, "UID:metrics"]
+            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, UID_METRICS]
         )
         
         issue2 = mock_issue_factory(
             number=102,
-            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, "UID:metrics"]
+            labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, UID_METRICS]
         )
         
         # Setup mock for get_issues
@@ -857,50 +870,29 @@ class TestCanonicalStoreFinding:
         
         # Verify results - should find duplicates for "UID:metrics"
         assert len(duplicates) == 1
-        assert "UID:metrics" in duplicates
-        assert len(duplicates["UID:metrics"]) == 2
-
-    def test_find_aliases(self, canonical_store, mock_alias_issue):
-        """Test finding aliases for objects."""
-        # Set mock_alias_issue number
-        mock_alias_issue.number = 789
-        
-        # Set up repository to return a list of alias issues
-        canonical_store.repo.get_issues.return_value = [mock_alias_issue]
-        
-        # Mock _get_object_id method
-        canonical_store._get_object_id = Mock(return_value="daily-metrics")
-        
-        # Execute find_aliases
-        aliases = canonical_store.find_aliases()
-        
-        # Verify results
-        assert len(aliases) == 1
-        assert aliases["daily-metrics"] == "metrics"
+        assert UID_METRICS in duplicates
+        assert len(duplicates[UID_METRICS]) == 2
 
-    def test_find_aliases_for_specific_object(self, canonical_store, mock_alias_issue):
-        """Test finding aliases for a specific object."""
-        # Set mock_alias_issue number
-        mock_alias_issue.number = 789
-        
+    @pytest.mark.parametrize("object_id, expected_label", [
+        (None, f"{LabelNames.ALIAS_TO_PREFIX}*"),
+        ("metrics", f"{LabelNames.ALIAS_TO_PREFIX}metrics"),
+    ])
+    def test_find_aliases(self, canonical_store, mock_alias_issue, object_id, expected_label):
+        """Test finding all aliases, or aliases for a specific object."""
         # Set up repository to return a list of alias issues
         canonical_store.repo.get_issues.return_value = [mock_alias_issue]
         
         # Mock _get_object_id method
         canonical_store._get_object_id = Mock(return_value="daily-metrics")
         
-        # Execute find_aliases with specific object
-        aliases = canonical_store.find_aliases("metrics")
+        # Execute find_aliases, optionally scoped to a specific object
+        aliases = canonical_store.find_aliases(object_id) if object_id else canonical_store.find_aliases()
         
         # Verify results
-        assert len(aliases) == 1
-        assert aliases["daily-metrics"] == "metrics"
+        assert aliases == {"daily-metrics": "metrics"}
         
         # Verify correct query was made
-        canonical_store.repo.get_issues.assert_called_with(
-            labels=[f"{LabelNames.ALIAS_TO_PREFIX}metrics"],
-            state="all"
-        )
+        assert_label_query(canonical_store.repo.get_issues, expected_label)
     
     # def test_get_object_canonicalize_modes(self, canonical_store_with_mocks, mock_issue_factory, mock_comment_factory):
     #     """Test different canonicalization modes in get_object."""
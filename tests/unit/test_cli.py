@@ -1,238 +1,357 @@
 # tests/unit/test_cli.py (Updated for Iterator Support)
 
 import json
+from dataclasses import replace
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
-from gh_store.__main__ import CLI
 from gh_store.cli import commands
 from gh_store.core.exceptions import GitHubStoreError
+from tests.unit.fixtures.cli import FROZEN_NOW
+
+# Error handling comes first so regressions fail fast under -x
+pytestmark = pytest.mark.usefixtures("frozen_clock")
+
+# Payloads passed to the CLI as JSON strings, serialized once at import
+OBJECT_DATA = {"name": "test", "value": 42}
+OBJECT_DATA_JSON = json.dumps(OBJECT_DATA)
+OBJECT_CHANGES = {"value": 43}
+OBJECT_CHANGES_JSON = json.dumps(OBJECT_CHANGES)
+
+# Values orjson can't write as-is: an integer past 64 bits, non-ASCII text and a float exponent
+UNUSUAL_DATA = {"count": 12345678901234567890123, "name": "café", "ratio": 1e16}
+UNUSUAL_DATA_JSON = json.dumps(UNUSUAL_DATA)
+
+# Fixed point in time that existing snapshots were taken at
+SNAPSHOT_TIME = datetime(2025, 1, 10, tzinfo=timezone.utc)
+UPDATED_AFTER_SNAPSHOT = SNAPSHOT_TIME + timedelta(hours=2)
+
+# Snapshot files update_snapshot must reject, serialized once at import
+EMPTY_SNAPSHOT_JSON = b"{}"
+UNTIMED_SNAPSHOT_JSON = json.dumps({"repository": "owner/repo", "objects": {}}).encode()
+
+
+def assert_logged(caplog, text: str, level: str = "INFO"):
+    """Assert a captured record at this level mentions text, without rendering caplog.text."""
+    assert any(r.levelname == level and text in r.getMessage() for r in caplog.records)
+
+def load_json(path: Path):
+    """Read a JSON file written by the CLI, decoding the raw bytes directly."""
+    return json.loads(path.read_bytes())
+
+class TestCLIErrorHandling:
+    """Test CLI error handling scenarios"""
+    
+    @pytest.mark.parametrize("command", ["create", "update"])
+    def test_invalid_json_data(self, mock_cli, command):
+        """Test handling of invalid JSON input"""
+        with pytest.raises(json.decoder.JSONDecodeError) as exc_info:
+            getattr(mock_cli, command)("test-123", "invalid json")
+    
+    @pytest.mark.parametrize("command, store_method, args", [
+        ("get", "get", ("test-123",)),
+        ("create", "create", ("test-123", OBJECT_DATA_JSON)),
+        ("update", "update", ("test-123", OBJECT_CHANGES_JSON)),
+        ("delete", "delete", ("test-123",)),
+        ("history", "get_object_history", ("test-123",)),
+    ], ids=["get", "create", "update", "delete", "history"])
+    def test_command_reraises_store_error(self, mock_cli, mock_store, caplog, command, store_method, args):
+        """Test that object commands log store failures and re-raise them"""
+        getattr(mock_store, store_method).side_effect = GitHubStoreError("Object not found")
+        
+        with pytest.raises(GitHubStoreError):
+            getattr(mock_cli, command)(*args)
+        
+        assert any(r.levelname == "ERROR" for r in caplog.records)
+    
+    @pytest.mark.parametrize("error", [
+        GitHubStoreError("Object not found"),
+        RuntimeError("Unexpected failure"),
+    ], ids=["store_error", "unexpected_error"])
+    def test_process_updates_exits_on_error(self, mock_cli, mock_store, error):
+        """Test that process_updates exits with status 1 on any failure"""
+        mock_store.process_updates.side_effect = error
+        
+        with pytest.raises(SystemExit) as exc_info:
+            mock_cli.process_updates(123)
+        
+        assert exc_info.value.code == 1
+    
+    def test_file_not_found(self, mock_cli, caplog):
+        """Test handling of missing snapshot file"""
+        with pytest.raises(FileNotFoundError) as exc_info:
+            mock_cli.update_snapshot("/nonexistent/path")
+            
+        assert "Snapshot file not found" in str(exc_info.value)
+        assert_logged(caplog, "Unexpected error occurred", level="ERROR")
 
 class TestCLIBasicOperations:
     """Test basic CLI operations like create, get, update, delete"""
     
-    def test_create_object(self, mock_cli, mock_store_response, tmp_path, caplog):
+    def test_create_object(self, mock_cli, mock_store, mock_store_response, tmp_path, caplog):
         """Test creating a new object via CLI"""
-        data = json.dumps({"name": "test", "value": 42})
+        mock_store.create.return_value = mock_store_response
         
-        with patch('gh_store.cli.commands.get_store') as mock_get_store:
-            mock_store = Mock()
-            mock_get_store.return_value = mock_store
-            mock_store.create.return_value = mock_store_response
-            
-            # Execute command
-            mock_cli.create("test-123", data)
-            
-            # Verify store interactions
-            mock_store.create.assert_called_once_with(
-                "test-123",
-                {"name": "test", "value": 42}
-            )
-            assert "Created object test-123" in caplog.text
-    
-    def test_get_object(self, mock_cli, mock_store_response, tmp_path):
-        """Test retrieving an object via CLI"""
+        # Execute command
+        mock_cli.create("test-123", OBJECT_DATA_JSON)
+        
+        # Verify store interactions
+        mock_store.create.assert_called_once_with("test-123", OBJECT_DATA)
+        assert_logged(caplog, "Created object test-123")
+    
+    def test_create_preserves_large_integers(self, mock_cli, mock_store, mock_store_response):
+        """Test that integers past 64 bits are passed to the store exactly"""
+        mock_store.create.return_value = mock_store_response
+        
+        mock_cli.create("test-123", UNUSUAL_DATA_JSON)
+        
+        mock_store.create.assert_called_once_with("test-123", UNUSUAL_DATA)
+        assert type(mock_store.create.call_args.args[1]["count"]) is int
+    
+    def test_get_object_with_unusual_values(self, mock_cli, mock_store, mock_store_response, tmp_path):
+        """Test that data orjson can't represent is still written, in the stdlib's layout"""
+        mock_store.get.return_value = replace(mock_store_response, data=UNUSUAL_DATA)
         output_file = tmp_path / "output.json"
         
-        with patch('gh_store.cli.commands.get_store') as mock_get_store:
-            mock_store = Mock()
-            mock_get_store.return_value = mock_store
-            mock_store.get.return_value = mock_store_response
-            
-            # Execute command
-            mock_cli.get("test-123", output=str(output_file))
-            
-            # Verify output file
+        mock_cli.get("test-123", output=str(output_file))
+        
+        content = load_json(output_file)
+        assert content["data"] == UNUSUAL_DATA
+        assert output_file.read_bytes() == json.dumps(content, indent=2).encode()
+    
+    @pytest.mark.parametrize("output", [None, "output.json"], ids=["stdout", "file"])
+    def test_get_object(self, mock_cli, mock_store, mock_store_response, tmp_path, capsys, output):
+        """Test retrieving an object via CLI, printed or written to a file"""
+        output_file = tmp_path / output if output else None
+        
+        mock_store.get.return_value = mock_store_response
+        
+        # Execute command
+        mock_cli.get("test-123", output=str(output_file) if output_file else None)
+        
+        # Verify output went to the requested destination
+        if output_file:
             assert output_file.exists()
-            content = json.loads(output_file.read_text())
-            assert content["object_id"] == "test-123"
-            assert content["data"] == {"name": "test", "value": 42}
+            content = load_json(output_file)
+        else:
+            content = json.loads(capsys.readouterr().out)
+        assert content["object_id"] == "test-123"
+        assert content["data"] == OBJECT_DATA
     
-    def test_delete_object(self, mock_cli, mock_store_response, caplog):
+    def test_delete_object(self, mock_cli, mock_store, mock_store_response, caplog):
         """Test deleting an object via CLI"""
-        with patch('gh_store.cli.commands.get_store') as mock_get_store:
-            mock_store = Mock()
-            mock_get_store.return_value = mock_store
-            
-            # Execute command
-            mock_cli.delete("test-123")
-            
-            # Verify store interactions
-            mock_store.delete.assert_called_once_with("test-123")
-            assert "Deleted object test-123" in caplog.text
+        # Execute command
+        mock_cli.delete("test-123")
+        
+        # Verify store interactions
+        mock_store.delete.assert_called_once_with("test-123")
+        assert_logged(caplog, "Deleted object test-123")
+    
+    def test_history(self, mock_cli, mock_store, capsys):
+        """Test printing an object's history via CLI"""
+        history = [{"type": "initial_state", "data": OBJECT_DATA, "timestamp": "2025-01-01T00:00:00+00:00"}]
+        mock_store.get_object_history.return_value = history
+        
+        # Execute command
+        mock_cli.history("test-123")
+        
+        mock_store.get_object_history.assert_called_once_with("test-123")
+        assert json.loads(capsys.readouterr().out) == history
 
 class TestCLIUpdateOperations:
     """Test update-related CLI operations"""
     
-    def test_update_object(self, mock_cli, mock_store_response, caplog):
+    def test_update_object(self, mock_cli, mock_store, mock_store_response, caplog):
         """Test updating an object via CLI"""
-        changes = json.dumps({"value": 43})
+        mock_store.update.return_value = mock_store_response
         
-        with patch('gh_store.cli.commands.get_store') as mock_get_store:
-            mock_store = Mock()
-            mock_get_store.return_value = mock_store
-            mock_store.update.return_value = mock_store_response
-            
-            # Execute command
-            mock_cli.update("test-123", changes)
-            
-            # Verify store interactions
-            mock_store.update.assert_called_once_with(
-                "test-123",
-                {"value": 43}
-            )
-            assert "Updated object" in caplog.text
-    
-    def test_process_updates(self, mock_cli, mock_store_response, caplog):
+        # Execute command
+        mock_cli.update("test-123", OBJECT_CHANGES_JSON)
+        
+        # Verify store interactions
+        mock_store.update.assert_called_once_with("test-123", OBJECT_CHANGES)
+        assert_logged(caplog, "Updated object")
+    
+    def test_process_updates(self, mock_cli, mock_store, mock_store_response, caplog):
         """Test processing pending updates via CLI"""
-        with patch('gh_store.cli.commands.get_store') as mock_get_store:
-            mock_store = Mock()
-            mock_get_store.return_value = mock_store
-            mock_store.process_updates.return_value = mock_store_response
-            
-            # Execute command
-            mock_cli.process_updates(123)
-            
-            # Verify store interactions
-            mock_store.process_updates.assert_called_once_with(123)
+        mock_store.process_updates.return_value = mock_store_response
+        
+        # Execute command
+        mock_cli.process_updates(123)
+        
+        # Verify store interactions
+        mock_store.process_updates.assert_called_once_with(123)
 
 # Add to tests/unit/test_cli.py - Enhanced snapshot tests
 
 class TestCLISnapshotOperations:
     """Test snapshot-related CLI operations"""
     
-    def test_create_snapshot(self, mock_cli, mock_stored_objects, tmp_path, caplog):
+    def test_create_snapshot(self, mock_cli, mock_store, mock_stored_objects, tmp_path, caplog):
         """Test creating a snapshot via CLI"""
         output_path = tmp_path / "snapshot.json"
         
-        with patch('gh_store.cli.commands.get_store') as mock_get_store:
-            mock_store = Mock()
-            mock_get_store.return_value = mock_store
-            
-            # Create iterator from mock_stored_objects
-            mock_store.list_all.return_value = mock_stored_objects
-            
-            # Execute command
-            mock_cli.snapshot(output=str(output_path))
-            
-            # Verify output
-            assert output_path.exists()
-            snapshot = json.loads(output_path.read_text())
-            assert "snapshot_time" in snapshot
-            assert len(snapshot["objects"]) == len(mock_stored_objects)
-            assert "Snapshot written to" in caplog.text
-    
-    def test_update_snapshot_with_changes(self, mock_cli, mock_stored_objects, mock_snapshot_file_factory, caplog):
-        """Test updating snapshot when objects have actually changed."""
-        # Create a snapshot with a known timestamp
-        one_day_ago = datetime.now(timezone.utc) - timedelta(days=1)
-        snapshot_path = mock_snapshot_file_factory(snapshot_time=one_day_ago, include_objects=[0])
-        
-        with patch('gh_store.cli.commands.get_store') as mock_get_store:
-            mock_store = Mock()
-            mock_get_store.return_value = mock_store
-            
-            # Configure a mock object that's newer than the snapshot
-            updated_obj = mock_stored_objects[1]
-            updated_obj.meta.updated_at = one_day_ago + timedelta(hours=2)
-            
-            # Only return the "updated" object
-            mock_store.list_updated_since.return_value = [updated_obj]
-            
-            # Store original snapshot data for comparison
-            original_snapshot = json.loads(snapshot_path.read_text())
-            
-            # Execute command
-            mock_cli.update_snapshot(str(snapshot_path))
-            
-            # Verify correct arguments
-            mock_store.list_updated_since.assert_called_once()
-            assert mock_store.list_updated_since.call_args[0][0] == one_day_ago
-            
-            # Read updated snapshot
-            updated_snapshot = json.loads(snapshot_path.read_text())
-            
-            # Verify timestamp was updated
-            assert updated_snapshot["snapshot_time"] != original_snapshot["snapshot_time"]
-            
-            # Verify updated object was added
-            assert updated_obj.meta.object_id in updated_snapshot["objects"]
-            
-            # Verify log message
-            assert "Updated 1 objects in snapshot" in caplog.text
-    
-    def test_update_snapshot_no_changes(self, mock_cli, mock_stored_objects, mock_snapshot_file_factory, caplog):
-        """Test not updating snapshot when no objects have changed."""
-        # Create a snapshot with a known timestamp
-        one_day_ago = datetime.now(timezone.utc) - timedelta(days=1)
-        snapshot_path = mock_snapshot_file_factory(snapshot_time=one_day_ago)
-        
-        with patch('gh_store.cli.commands.get_store') as mock_get_store:
-            mock_store = Mock()
-            mock_get_store.return_value = mock_store
-            
-            # Return empty iterator - no objects were updated
-            mock_store.list_updated_since.return_value = []
-            
-            # Store original snapshot data for comparison
-            original_snapshot = json.loads(snapshot_path.read_text())
-            
-            # Execute command
-            mock_cli.update_snapshot(str(snapshot_path))
-            
-            # Read updated snapshot
-            updated_snapshot = json.loads(snapshot_path.read_text())
-            
-            # Verify timestamp was NOT updated
-            assert updated_snapshot["snapshot_time"] == original_snapshot["snapshot_time"]
-            
-            # Verify objects are unchanged
-            assert updated_snapshot["objects"] == original_snapshot["objects"]
-            
-            # Verify log message
-            assert "No updates found since last snapshot" in caplog.text
+        # Create iterator from mock_stored_objects
+        objects_iter = iter(mock_stored_objects)
+        mock_store.list_all.return_value = objects_iter
+        
+        # Execute command
+        mock_cli.snapshot(output=str(output_path))
+        
+        # Verify objects were streamed from the iterator
+        assert next(objects_iter, None) is None
+        
+        # Verify output
+        assert output_path.exists()
+        snapshot = load_json(output_path)
+        assert snapshot["snapshot_time"] == FROZEN_NOW.isoformat()
+        assert len(snapshot["objects"]) == len(mock_stored_objects)
+        for obj in mock_stored_objects:
+            assert snapshot["objects"][obj.meta.object_id]["data"] == obj.data
+        assert_logged(caplog, "Snapshot written to")
     
-    def test_update_snapshot_empty_file(self, mock_cli, mock_stored_objects, tmp_path, caplog):
+    def test_create_snapshot_empty_store(self, mock_cli, mock_store, tmp_path, caplog):
+        """Test creating a snapshot when the store has no objects"""
+        output_path = tmp_path / "snapshot.json"
+        
+        mock_store.list_all.return_value = iter([])
+        
+        # Execute command
+        mock_cli.snapshot(output=str(output_path))
+        
+        # Verify output is still a valid snapshot
+        snapshot = load_json(output_path)
+        assert snapshot["objects"] == {}
+        assert_logged(caplog, "Captured 0 objects")
+    
+    def test_snapshot_duplicate_ids_keep_first_entry(self, mock_cli, mock_store, mock_stored_objects, tmp_path, caplog):
+        """Test that a repeated object ID keeps the entry already streamed to disk"""
+        output_path = tmp_path / "snapshot.json"
+        first, second = mock_stored_objects[:2]
+        later_first = replace(first, data={"name": "later"})
+        mock_store.list_all.return_value = iter([first, second, later_first])
+        
+        mock_cli.snapshot(output=str(output_path))
+        
+        objects = load_json(output_path)["objects"]
+        assert list(objects) == [first.meta.object_id, second.meta.object_id]
+        assert objects[first.meta.object_id]["data"] == first.data
+        assert_logged(caplog, "Captured 2 objects")
+        assert_logged(caplog, f"Skipping duplicate entry for object {first.meta.object_id}", level="WARNING")
+    
+    def test_failed_snapshot_write_leaves_no_temp_file(self, tmp_path):
+        """Test that a write failing partway removes the temp file and keeps the old snapshot"""
+        output_path = tmp_path / "snapshot.json"
+        output_path.write_bytes(EMPTY_SNAPSHOT_JSON)
+        entries = [("written", {"value": 1}), ("unserializable", {"value": object()})]
+        
+        with pytest.raises(TypeError):
+            commands._write_snapshot(output_path, {"repository": "owner/repo"}, entries)
+        
+        assert list(tmp_path.iterdir()) == [output_path]
+        assert output_path.read_bytes() == EMPTY_SNAPSHOT_JSON
+    
+    @pytest.mark.parametrize("backend", ["orjson", "json"])
+    def test_snapshot_format_independent_of_backend(self, mock_cli, mock_store, mock_stored_objects, tmp_path, monkeypatch, backend):
+        """Test that snapshots are byte-identical whichever JSON backend writes them"""
+        if backend == "orjson" and commands.orjson is None:
+            pytest.skip("orjson not installed")
+        if backend == "json":
+            monkeypatch.setattr(commands, "orjson", None)
+        output_path = tmp_path / "snapshot.json"
+        mock_store.list_all.return_value = iter(mock_stored_objects)
+        
+        # Execute command
+        mock_cli.snapshot(output=str(output_path))
+        
+        # Verify output matches the stdlib's indented, ASCII-escaped layout
+        snapshot = json.loads(output_path.read_bytes())
+        assert snapshot["objects"]["test-obj-3"]["data"] == mock_stored_objects[2].data
+        assert output_path.read_bytes() == json.dumps(snapshot, indent=2).encode()
+    
+    def test_update_snapshot(self, mock_cli, mock_store, mock_stored_objects, mock_snapshot_file_factory, caplog):
+        """Test updating a snapshot with objects changed since it was taken."""
+        # Create a snapshot holding only the first object, with a known timestamp
+        snapshot_path = mock_snapshot_file_factory(snapshot_time=SNAPSHOT_TIME, include_objects=[0])
+        
+        # The second object is newer than the snapshot
+        updated_obj = mock_stored_objects[1]
+        updated_obj.meta.updated_at = UPDATED_AFTER_SNAPSHOT
+        mock_store.list_updated_since.return_value = [updated_obj]
+        
+        # Store original snapshot data for comparison
+        original_snapshot = load_json(snapshot_path)
+        
+        # Execute command
+        mock_cli.update_snapshot(str(snapshot_path))
+        
+        # Verify correct arguments
+        mock_store.list_updated_since.assert_called_once_with(SNAPSHOT_TIME)
+        
+        # Read updated snapshot
+        updated_snapshot = load_json(snapshot_path)
+        
+        # Timestamp moves forward to the time of the update
+        assert updated_snapshot["snapshot_time"] == FROZEN_NOW.isoformat()
+        
+        # Verify existing objects are kept and the updated object was added
+        for object_id, entry in original_snapshot["objects"].items():
+            assert updated_snapshot["objects"][object_id] == entry
+        assert updated_obj.meta.object_id in updated_snapshot["objects"]
+        
+        # Verify log message
+        assert_logged(caplog, "Updated 1 objects in snapshot")
+    
+    def test_update_snapshot_without_changes(self, mock_cli, mock_store, mock_snapshot_file_factory, caplog):
+        """Test that a snapshot with nothing newer is left byte-for-byte untouched."""
+        snapshot_path = mock_snapshot_file_factory(snapshot_time=SNAPSHOT_TIME)
+        original_bytes = snapshot_path.read_bytes()
+        mock_store.list_updated_since.return_value = []
+        
+        # Execute command
+        mock_cli.update_snapshot(str(snapshot_path))
+        
+        mock_store.list_updated_since.assert_called_once_with(SNAPSHOT_TIME)
+        assert snapshot_path.read_bytes() == original_bytes
+        assert_logged(caplog, "No updates found since last snapshot")
+    
+    @pytest.mark.parametrize("content, error", [
+        (EMPTY_SNAPSHOT_JSON, KeyError),
+        (UNTIMED_SNAPSHOT_JSON, KeyError),
+        (b"invalid json", json.JSONDecodeError),
+    ], ids=["empty_object", "missing_snapshot_time", "invalid_json"])
+    def test_update_snapshot_invalid_content(self, mock_cli, mock_store, tmp_path, caplog, content, error):
         """Test error handling when updating a snapshot with invalid content."""
-        empty_file = tmp_path / "empty.json"
-        empty_file.write_text("{}")
+        snapshot_path = tmp_path / "snapshot.json"
+        snapshot_path.write_bytes(content)
         
-        with pytest.raises(Exception) as exc_info:
-            mock_cli.update_snapshot(str(empty_file))
-            
+        with pytest.raises(error):
+            mock_cli.update_snapshot(str(snapshot_path))
+        
+        assert_logged(caplog, "Unexpected error occurred", level="ERROR")
 
-class TestCLIErrorHandling:
-    """Test CLI error handling scenarios"""
-    
-    def test_invalid_json_data(self, mock_cli):
-        """Test handling of invalid JSON input"""
-        with pytest.raises(json.decoder.JSONDecodeError) as exc_info:
-            mock_cli.create("test-123", "invalid json")
+class TestCLIStoreConstruction:
+    """Test how CLI commands resolve store credentials"""
     
-    def test_file_not_found(self, mock_cli, caplog):
-        """Test handling of missing snapshot file"""
-        with pytest.raises(FileNotFoundError) as exc_info:
-            mock_cli.update_snapshot("/nonexistent/path")
-            
-        assert "Snapshot file not found" in caplog.text
+    @pytest.mark.parametrize("args, token, repo", [
+        ({}, "test-token", "owner/repo"),
+        ({"token": "cli-token", "repo": "cli/repo"}, "cli-token", "cli/repo"),
+    ], ids=["env_vars", "explicit_args"])
+    def test_get_store_credentials(self, monkeypatch, args, token, repo):
+        """Test that explicit arguments take precedence over environment variables"""
+        store_cls = Mock()
+        monkeypatch.setattr(commands, "GitHubStore", store_cls)
+        
+        commands.get_store(**args)
+        
+        store_cls.assert_called_once_with(token=token, repo=repo, config_path=None)
 
 # should probably just deprecate all the config stuff.
 # class TestCLIConfigHandling:
 #     """Test CLI configuration handling"""
     
-#     def test_init_creates_config(self, mock_cli, tmp_path, caplog):
-#         """Test initialization of new config file."""
-#         config_path = tmp_path / "new_config.yml"
-        
-#         with patch('gh_store.cli.commands.ensure_config_exists') as mock_ensure:
-#             # Run command
-#             mock_cli.init(config=str(config_path))
-            
-#             # Verify config creation was attempted
-#             mock_ensure.assert_called_once_with(config_path)
-    
 #     def test_custom_config_path(self, mock_cli, mock_config, mock_store_response):
 #         """Test using custom config path"""
 #         with patch('gh_store.cli.commands.get_store') as mock_get_store, \
@@ -1,12 +1,53 @@
 # tests/unit/test_comment_handler.py
 
 import json
-from datetime import datetime, timezone
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 from gh_store.handlers.comment import CommentHandler
 from gh_store.core.version import CLIENT_VERSION
+from tests.unit.fixtures.github import DEFAULT_CREATED_AT, DEFAULT_UPDATED_AT, REACTION_CONTENTS
+
+def update_body_json(data, timestamp='2025-01-01T00:00:00Z', **fields):
+    """Serialize an issue-123 update comment body in the current metadata format."""
+    return json.dumps({
+        **fields,
+        '_data': data,
+        '_meta': {
+            'client_version': CLIENT_VERSION,
+            'timestamp': timestamp,
+            'update_mode': 'append',
+            'issue_number': 123
+        }
+    })
+
+# Comment bodies, serialized once at import
+VALID_UPDATE_BODY_JSON = update_body_json({'update': 'valid'})
+PROCESSED_UPDATE_BODY_JSON = update_body_json({'update': 'processed'})
+ANOTHER_PROCESSED_BODY_JSON = update_body_json({'another': 'processed'})
+INITIAL_STATE_BODY_JSON = update_body_json({'initial': 'state'}, type='initial_state')
+UNAUTHORIZED_UPDATE_BODY_JSON = update_body_json({'update': 'unauthorized'}, timestamp='2025-01-02T00:00:00Z')
+MALICIOUS_UPDATE_BODY_JSON = update_body_json({'malicious': 'update'})
+TEAM_UPDATE_BODY_JSON = update_body_json({'update': 'from-team'})
+MALFORMED_META_BODY_JSON = json.dumps({
+    '_data': {'test': 'data'},
+    # Missing required fields, including issue_number
+    '_meta': {'client_version': CLIENT_VERSION}
+})
+
+def listed_comment(comment_id, body, login="owner", created_at=None, reactions=()):
+    """Stand-in for a comment from get_comments(), carrying GitHub's reaction summary."""
+    summary = dict.fromkeys(REACTION_CONTENTS, 0)
+    for content in reactions:
+        summary[content] += 1
+    return SimpleNamespace(
+        id=comment_id,
+        body=body,
+        created_at=created_at,
+        user=SimpleNamespace(login=login),
+        reactions=summary,
+    )
 
 @pytest.fixture
 def mock_repo():
@@ -25,7 +66,11 @@ def mock_config():
 
 @pytest.fixture
 def comment_handler(mock_repo, mock_config):
-    return CommentHandler(mock_repo, mock_config)
+    handler = CommentHandler(mock_repo, mock_config)
+    # Only "owner" is authorized unless a test supplies CODEOWNERS content
+    handler.access_control._owner_info = {"login": "owner", "type": "User"}
+    handler.access_control._find_codeowners_file = Mock(return_value=None)
+    return handler
 
 def test_get_unprocessed_updates_mixed_comments(comment_handler, mock_repo):
     """Test processing a mix of valid and invalid comments"""
@@ -38,106 +83,29 @@ def test_get_unprocessed_updates_mixed_comments(comment_handler, mock_repo):
     # Create a variety of comments to test filtering
     comments = [
         # Valid update with metadata from authorized user
-        Mock(
-            id=1,
-            body=json.dumps({
-                '_data': {'update': 'valid'},
-                '_meta': {
-                    'client_version': CLIENT_VERSION,
-                    'timestamp': '2025-01-01T00:00:00Z',
-                    'update_mode': 'append',
-                    'issue_number': 123  # Add issue number
-                }
-            }),
-            created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
-            user=Mock(login="owner"),
-            get_reactions=Mock(return_value=[])  # No reactions = unprocessed
-        ),
+        listed_comment(1, VALID_UPDATE_BODY_JSON, created_at=DEFAULT_CREATED_AT),  # No reactions = unprocessed
         
         # Already processed update (should be skipped)
-        Mock(
-            id=2,
-            body=json.dumps({
-                '_data': {'update': 'processed'},
-                '_meta': {
-                    'client_version': CLIENT_VERSION,
-                    'timestamp': '2025-01-01T00:00:00Z',
-                    'update_mode': 'append',
-                    'issue_number': 123  # Add issue number
-                }
-            }),
-            user=Mock(login="owner"),
-            get_reactions=Mock(return_value=[Mock(content="+1")])
-        ),
+        listed_comment(2, PROCESSED_UPDATE_BODY_JSON, reactions=["+1"]),
         
         # Legacy format comment (should be handled with generated metadata)
-        Mock(
-            id=3,
-            body='{"legacy": "update"}',
-            created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
-            user=Mock(login="owner"),
-            get_reactions=Mock(return_value=[])
-        ),
+        listed_comment(3, '{"legacy": "update"}', created_at=DEFAULT_CREATED_AT),
         
         # Initial state comment (should be skipped)
-        Mock(
-            id=4,
-            body=json.dumps({
-                'type': 'initial_state',
-                '_data': {'initial': 'state'},
-                '_meta': {
-                    'client_version': CLIENT_VERSION,
-                    'timestamp': '2025-01-01T00:00:00Z',
-                    'update_mode': 'append',
-                    'issue_number': 123  # Add issue number
-                }
-            }),
-            user=Mock(login="owner"),
-            get_reactions=Mock(return_value=[])
-        ),
+        listed_comment(4, INITIAL_STATE_BODY_JSON),
         
         # Invalid JSON comment (should be skipped)
-        Mock(
-            id=5,
-            body='not json',
-            user=Mock(login="owner"),
-            get_reactions=Mock(return_value=[])
-        ),
+        listed_comment(5, 'not json'),
         
         # Valid JSON but unauthorized user (should be skipped)
-        Mock(
-            id=6,
-            body=json.dumps({
-                '_data': {'update': 'unauthorized'},
-                '_meta': {
-                    'client_version': CLIENT_VERSION,
-                    'timestamp': '2025-01-02T00:00:00Z',
-                    'update_mode': 'append',
-                    'issue_number': 123  # Add issue number
-                }
-            }),
-            created_at=datetime(2025, 1, 2, tzinfo=timezone.utc),
-            user=Mock(login="random-user"),
-            get_reactions=Mock(return_value=[])
-        ),
+        listed_comment(6, UNAUTHORIZED_UPDATE_BODY_JSON, login="random-user", created_at=DEFAULT_UPDATED_AT),
         
         # Regular discussion comment (should be skipped)
-        Mock(
-            id=7,
-            body='Just a regular comment',
-            user=Mock(login="random-user"),
-            get_reactions=Mock(return_value=[])
-        )
+        listed_comment(7, 'Just a regular comment', login="random-user")
     ]
     
     issue.get_comments.return_value = comments
     
-    # Mock the access control to only authorize "owner"
-    comment_handler.access_control._get_owner_info = Mock(
-        return_value={"login": "owner", "type": "User"}
-    )
-    comment_handler.access_control._find_codeowners_file = Mock(return_value=None)
-    
     # Get unprocessed updates
     updates = comment_handler.get_unprocessed_updates(123)
     
@@ -155,30 +123,10 @@ def test_get_unprocessed_updates_unauthorized_json(comment_handler, mock_repo):
     mock_repo.get_issue.return_value = issue
     
     # Create an unauthorized but valid JSON update
-    comment = Mock(
-        id=1,
-        body=json.dumps({
-            '_data': {'malicious': 'update'},
-            '_meta': {
-                'client_version': CLIENT_VERSION,
-                'timestamp': '2025-01-01T00:00:00Z',
-                'update_mode': 'append',
-                'issue_number': 123  # Add issue number
-            }
-        }),
-        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
-        user=Mock(login="attacker"),
-        get_reactions=Mock(return_value=[])
-    )
+    comment = listed_comment(1, MALICIOUS_UPDATE_BODY_JSON, login="attacker", created_at=DEFAULT_CREATED_AT)
     
     issue.get_comments.return_value = [comment]
     
-    # Mock access control to reject the user
-    comment_handler.access_control._get_owner_info = Mock(
-        return_value={"login": "owner", "type": "User"}
-    )
-    comment_handler.access_control._find_codeowners_file = Mock(return_value=None)
-    
     updates = comment_handler.get_unprocessed_updates(123)
     assert len(updates) == 0
 
@@ -191,46 +139,14 @@ def test_get_unprocessed_updates_with_codeowners(comment_handler, mock_repo):
     # Create comments from different users
     comments = [
         # From CODEOWNERS team member
-        Mock(
-            id=1,
-            body=json.dumps({
-                '_data': {'update': 'from-team'},
-                '_meta': {
-                    'client_version': CLIENT_VERSION,
-                    'timestamp': '2025-01-01T00:00:00Z',
-                    'update_mode': 'append',
-                    'issue_number': 123  # Add issue number
-                }
-            }),
-            created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
-            user=Mock(login="team-member"),
-            get_reactions=Mock(return_value=[])
-        ),
+        listed_comment(1, TEAM_UPDATE_BODY_JSON, login="team-member", created_at=DEFAULT_CREATED_AT),
         # From unauthorized user
-        Mock(
-            id=2,
-            body=json.dumps({
-                '_data': {'update': 'unauthorized'},
-                '_meta': {
-                    'client_version': CLIENT_VERSION,
-                    'timestamp': '2025-01-02T00:00:00Z',
-                    'update_mode': 'append',
-                    'issue_number': 123  # Add issue number
-                }
-            }),
-            created_at=datetime(2025, 1, 2, tzinfo=timezone.utc),
-            user=Mock(login="random-user"),
-            get_reactions=Mock(return_value=[])
-        )
+        listed_comment(2, UNAUTHORIZED_UPDATE_BODY_JSON, login="random-user", created_at=DEFAULT_UPDATED_AT)
     ]
     
     issue.get_comments.return_value = comments
     
-    # Mock CODEOWNERS to include team-member
-    comment_handler.access_control._get_owner_info = Mock(
-        return_value={"login": "owner", "type": "User"}
-    )
-    # Set up CODEOWNERS content
+    # Set up CODEOWNERS content to include team-member
     codeowners_content = "* @team-member"
     comment_handler.access_control._find_codeowners_file = Mock(
         return_value=codeowners_content
@@ -261,34 +177,8 @@ def test_get_unprocessed_updates_all_processed(comment_handler, mock_repo):
     
     # Create some processed comments
     comments = [
-        Mock(
-            id=1,
-            body=json.dumps({
-                '_data': {'update': 'processed'},
-                '_meta': {
-                    'client_version': CLIENT_VERSION,
-                    'timestamp': '2025-01-01T00:00:00Z',
-                    'update_mode': 'append',
-                    'issue_number': 123  # Add issue number
-                }
-            }),
-            user=Mock(login="owner"),
-            get_reactions=Mock(return_value=[Mock(content="+1")])
-        ),
-        Mock(
-            id=2,
-            body=json.dumps({
-                '_data': {'another': 'processed'},
-                '_meta': {
-                    'client_version': CLIENT_VERSION,
-                    'timestamp': '2025-01-01T00:00:00Z',
-                    'update_mode': 'append',
-                    'issue_number': 123  # Add issue number
-                }
-            }),
-            user=Mock(login="owner"),
-            get_reactions=Mock(return_value=[Mock(content="+1")])
-        )
+        listed_comment(1, PROCESSED_UPDATE_BODY_JSON, reactions=["+1"]),
+        listed_comment(2, ANOTHER_PROCESSED_BODY_JSON, reactions=["+1"])
     ]
     
     issue.get_comments.return_value = comments
@@ -324,49 +214,47 @@ def test_get_unprocessed_updates_malformed_metadata(comment_handler, mock_repo):
     mock_repo.get_issue.return_value = issue
     
     # Create comment with malformed metadata
-    malformed_comment = Mock(
-        id=1,
-        body=json.dumps({
-            '_data': {'test': 'data'},
-            '_meta': {
-                # Missing required fields
-                'client_version': CLIENT_VERSION,
-                # missing issue_number
-            }
-        }),
-        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
-        user=Mock(login="owner"),
-        get_reactions=Mock(return_value=[])
-    )
+    malformed_comment = listed_comment(1, MALFORMED_META_BODY_JSON, created_at=DEFAULT_CREATED_AT)
     
     issue.get_comments.return_value = [malformed_comment]
     
-    # Mock access control
-    comment_handler.access_control._get_owner_info = Mock(
-        return_value={"login": "owner", "type": "User"}
-    )
-    comment_handler.access_control._find_codeowners_file = Mock(return_value=None)
-    
     # Should skip malformed comment
     updates = comment_handler.get_unprocessed_updates(123)
     assert len(updates) == 0
 
+@pytest.mark.parametrize("summary", [None, {"heart": 1}], ids=["no_summary", "processed_reaction_missing"])
+def test_is_processed_falls_back_to_reaction_listing(comment_handler, summary):
+    """Test that a comment whose summary can't answer has its reactions fetched"""
+    comment = SimpleNamespace(
+        reactions=summary,
+        get_reactions=Mock(return_value=[SimpleNamespace(content="+1")])
+    )
+    
+    assert comment_handler._is_processed(comment) is True
+    comment.get_reactions.assert_called_once()
+
+@pytest.mark.parametrize("meta", ["not-a-dict", ["client_version"], None])
+def test_validate_metadata_rejects_non_mapping(comment_handler, meta):
+    """Test that metadata which isn't an object is rejected rather than raising"""
+    assert comment_handler._validate_metadata(meta) is False
+
 def test_apply_update_preserves_metadata(comment_handler):
     """Test that applying updates preserves any existing metadata"""
     # Create mock object with existing metadata
-    obj = Mock()
-    obj.meta = Mock(object_id='test-123', issue_number=123)  # Add issue_number
-    obj.data = {
-        'value': 1,
-        '_meta': {
-            'some': 'metadata'
+    obj = SimpleNamespace(
+        meta=SimpleNamespace(object_id='test-123', issue_number=123),  # Add issue_number
+        data={
+            'value': 1,
+            '_meta': {
+                'some': 'metadata'
+            }
         }
-    }
+    )
     
     # Create update that includes metadata
-    update = Mock(
+    update = SimpleNamespace(
         comment_id=1,
-        timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        timestamp=DEFAULT_CREATED_AT,
         changes={
             'value': 2,
             '_meta': {
@@ -382,3 +270,16 @@ def test_apply_update_preserves_metadata(comment_handler):
     assert result.data['value'] == 2
     assert result.data['_meta']['some'] == 'metadata'
     assert result.data['_meta']['new'] == 'metadata'
+
+def test_deep_merge_copies_only_the_merged_path(comment_handler):
+    """Test that merging leaves its inputs untouched and only copies dicts it merges into"""
+    base = {'stats': {'count': 1}, 'config': {'mode': 'fast'}, 'tags': ['a']}
+    changes = {'stats': {'total': 5}, 'tags': ['b']}
+    
+    result = comment_handler._deep_merge(base, changes)
+    
+    assert result == {'stats': {'count': 1, 'total': 5}, 'config': {'mode': 'fast'}, 'tags': ['b']}
+    assert base == {'stats': {'count': 1}, 'config': {'mode': 'fast'}, 'tags': ['a']}
+    # Untouched nested values are shared with base rather than deep-copied
+    assert result['config'] is base['config']
+    assert result['stats'] is not base['stats']
@@ -1,47 +1,55 @@
 # tests/unit/test_config.py
 
+import os
 from pathlib import Path
+import shutil
 import pytest
-from unittest.mock import patch, mock_open
-import yaml
 
+from gh_store.core import store as store_module
 from gh_store.core.store import GitHubStore, DEFAULT_CONFIG_PATH
 
-def test_store_uses_default_config_when_no_path_provided(mock_github, mock_config_file):
+def test_store_uses_default_config_when_no_path_provided(mock_github, mock_config_file, tmp_path, monkeypatch):
     """Test that store uses packaged default config when no config exists"""
     _, mock_repo = mock_github
     
-    # Mock the default config path to not exist
-    with patch('pathlib.Path.exists', return_value=False):
-        store = GitHubStore(token="fake-token", repo="owner/repo")
-        
-        # Updated assertions to match fixture config
-        assert store.config.store.base_label == "stored-object"
-        assert store.config.store.reactions.processed == "+1"
+    # Point the default config path at a file that doesn't exist
+    monkeypatch.setattr(store_module, "DEFAULT_CONFIG_PATH", tmp_path / "config.yml")
+    store = GitHubStore(token="fake-token", repo="owner/repo")
+    
+    # Updated assertions to match fixture config
+    assert store.config.store.base_label == "stored-object"
+    assert store.config.store.reactions.processed == "+1"
 
-def test_store_uses_provided_config_path(mock_github, tmp_path):
-    """Test that store uses provided config path when it exists"""
-    _, mock_repo = mock_github
+def test_packaged_default_config_parsed_once(mock_github, mock_config_file, tmp_path, monkeypatch):
+    """Test that stores falling back to the packaged config share a single parse"""
+    monkeypatch.setattr(store_module, "DEFAULT_CONFIG_PATH", tmp_path / "config.yml")
+    first = GitHubStore(token="fake-token", repo="owner/repo")
+    second = GitHubStore(token="fake-token", repo="owner/repo")
     
-    # Create a test config file
-    config_path = tmp_path / "test_config.yml"
-    test_config = {
-        "store": {
-            "base_label": "stored-object",  # Matches fixture
-            "uid_prefix": "UID:",
-            "reactions": {
-                "processed": "+1",  # Matches fixture
-                "initial_state": "rocket"  # Matches fixture
-            }
-        }
-    }
-    config_path.write_text(yaml.dump(test_config))
-    
-    store = GitHubStore(token="fake-token", repo="owner/repo", config_path=config_path)
+    assert second.config is not first.config
+    assert second.config == first.config
+    mock_config_file.assert_called_once()
+
+def test_store_uses_provided_config_path(mock_github, test_config_file):
+    """Test that store uses provided config path when it exists"""
+    store = GitHubStore(token="fake-token", repo="owner/repo", config_path=test_config_file)
     
     assert store.config.store.base_label == "stored-object"
     assert store.config.store.reactions.processed == "+1"
 
+def test_store_uses_injected_config(mock_github, default_config, mock_config_file):
+    """Test that an already-loaded config is used without reading any file"""
+    store = GitHubStore(
+        token="fake-token",
+        repo="owner/repo",
+        config_path=Path("/nonexistent/config.yml"),
+        config=default_config
+    )
+    
+    assert store.config is default_config
+    assert store.issue_handler.config is default_config
+    mock_config_file.assert_not_called()
+
 def test_store_raises_error_for_nonexistent_custom_config(mock_github):
     """Test that store raises error when custom config path doesn't exist"""
     _, mock_repo = mock_github
@@ -57,3 +65,53 @@ def test_default_config_path_is_in_user_config_dir():
     """Test that default config path is in user's config directory"""
     expected_path = Path.home() / ".config" / "gh-store" / "config.yml"
     assert DEFAULT_CONFIG_PATH == expected_path
+
+def test_cli_shares_store_default_config_path(fresh_cli):
+    """Test that the CLI reuses the store's precomputed default config path"""
+    assert fresh_cli.default_config_path is DEFAULT_CONFIG_PATH
+
+def test_cli_init_creates_config_from_package_default(fresh_cli, tmp_path, default_config_bytes):
+    """Test that init copies the packaged default config to the requested path"""
+    config_path = tmp_path / "gh-store" / "config.yml"
+    
+    fresh_cli.init(config=str(config_path))
+    
+    assert config_path.read_bytes() == default_config_bytes
+
+def test_store_reuses_parsed_config_file(mock_github, test_config_file, mock_config_file):
+    """Test that stores built from an unchanged config file parse it only once"""
+    for _ in range(3):
+        GitHubStore(token="fake-token", repo="owner/repo", config_path=test_config_file)
+    
+    assert mock_config_file.call_count == 1
+
+def test_store_reparses_modified_config_file(mock_github, test_config_file, mock_config_file, tmp_path):
+    """Test that editing the config file invalidates the parsed config"""
+    # Touch a private copy; the session-wide config file is shared with other tests
+    config_path = tmp_path / "config.yml"
+    shutil.copyfile(test_config_file, config_path)
+    GitHubStore(token="fake-token", repo="owner/repo", config_path=config_path)
+    
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    GitHubStore(token="fake-token", repo="owner/repo", config_path=config_path)
+    
+    assert mock_config_file.call_count == 2
+
+def test_store_config_changes_stay_local(mock_github, test_config_file, mock_config_file, tmp_path, monkeypatch):
+    """Test that writes to one store's config don't leak into stores sharing its parse"""
+    monkeypatch.setattr(store_module, "DEFAULT_CONFIG_PATH", tmp_path / "config.yml")
+    for config_path in (test_config_file, None):
+        changed = GitHubStore(token="fake-token", repo="owner/repo", config_path=config_path)
+        changed.config.store.base_label = "changed"
+        
+        other = GitHubStore(token="fake-token", repo="owner/repo", config_path=config_path)
+        assert other.config.store.base_label == "stored-object"
+
+def test_store_caches_config_by_resolved_path(mock_github, test_config_file, mock_config_file, monkeypatch):
+    """Test that different spellings of the same config path share one parse"""
+    monkeypatch.chdir(test_config_file.parent)
+    GitHubStore(token="fake-token", repo="owner/repo", config_path=test_config_file)
+    GitHubStore(token="fake-token", repo="owner/repo", config_path=Path(test_config_file.name))
+    
+    assert mock_config_file.call_count == 1
@@ -1,11 +1,10 @@
 # tests/unit/test_object_history.py
 
 from datetime import datetime, timezone
-import json
 import pytest
-from unittest.mock import Mock
 
 from gh_store.core.exceptions import ObjectNotFound
+from tests.unit.fixtures.github import DEFAULT_CREATED_AT, DEFAULT_UPDATED_AT
 
 @pytest.fixture
 def history_mock_comments(mock_comment):
@@ -21,7 +20,7 @@ def history_mock_comments(mock_comment):
             "timestamp": "2025-01-01T00:00:00Z"
         },
         comment_id=1,
-        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc)
+        created_at=DEFAULT_CREATED_AT
     ))
     
     # First update
@@ -36,7 +35,7 @@ def history_mock_comments(mock_comment):
             }
         },
         comment_id=2,
-        created_at=datetime(2025, 1, 2, tzinfo=timezone.utc)
+        created_at=DEFAULT_UPDATED_AT
     ))
     
     # Second update
@@ -108,7 +107,7 @@ def test_get_object_history_legacy_format(store, mock_issue, mock_comment):
         user_login="repo-owner",
         body={"value": 43},  # Legacy format without metadata
         comment_id=1,
-        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc)
+        created_at=DEFAULT_CREATED_AT
     )
     
     issue = mock_issue(
@@ -1,15 +1,32 @@
 # tests/unit/test_security.py
 
-import json
-from datetime import datetime, timezone
+from types import SimpleNamespace
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from github import GithubException
 
 from gh_store.core.access import AccessControl
 from gh_store.core.exceptions import AccessDeniedError
 from gh_store.core.version import CLIENT_VERSION
 
+# CODEOWNERS file contents granting access to authorized-user
+AUTHORIZED_USER_CODEOWNERS = SimpleNamespace(decoded_content=b"* @authorized-user")
+
+# Well-formed update metadata; comment bodies are only serialized, so one dict is shared
+UPDATE_META = {
+    'client_version': CLIENT_VERSION,
+    'timestamp': '2025-01-01T00:00:00Z',
+    'update_mode': 'append'
+}
+
+def serve_issue_comments(store, comments, creator_login="repo-owner"):
+    """Make the store's repo return an issue carrying the given comments"""
+    issue = SimpleNamespace(
+        get_comments=lambda: comments,
+        user=SimpleNamespace(login=creator_login),
+    )
+    store.repo.get_issue = lambda number: issue
+
 # Authorization Tests
 
 def test_owner_always_authorized(mock_github):
@@ -22,13 +39,23 @@ def test_owner_always_authorized(mock_github):
     ac = AccessControl(mock_repo)
     assert ac._is_authorized("repo-owner") is True
 
+def test_missing_codeowners_looked_up_once(mock_github):
+    """Test that a missing CODEOWNERS file isn't searched for on every check"""
+    _, mock_repo = mock_github
+    mock_repo.get_contents = Mock(side_effect=GithubException(404, "Not found"))
+    
+    ac = AccessControl(mock_repo)
+    assert ac._is_authorized("random-user") is False
+    assert ac._is_authorized("other-user") is False
+    
+    assert mock_repo.get_contents.call_count == len(AccessControl.CODEOWNERS_PATHS)
+
 def test_codeowners_authorization(mock_github):
     """Test authorization via CODEOWNERS file"""
     _, mock_repo = mock_github
     
     # Override CODEOWNERS content
-    mock_content = Mock()
-    mock_content.decoded_content = b"* @maintainer @contributor"
+    mock_content = SimpleNamespace(decoded_content=b"* @maintainer @contributor")
     mock_repo.get_contents = Mock(return_value=mock_content)
     
     ac = AccessControl(mock_repo)
@@ -41,10 +68,7 @@ def test_organization_ownership(mock_github):
     _, mock_repo = mock_github
     
     # Override owner type
-    owner = Mock()
-    owner.login = "org-name"
-    owner.type = "Organization"
-    mock_repo.owner = owner
+    mock_repo.owner = SimpleNamespace(login="org-name", type="Organization")
     
     ac = AccessControl(mock_repo)
     owner_info = ac._get_owner_info()
@@ -53,23 +77,20 @@ def test_organization_ownership(mock_github):
     assert owner_info["type"] == "Organization"
     assert ac._is_authorized("org-name") is True
 
-def test_codeowners_file_locations(mock_github):
+@pytest.mark.parametrize("test_path", ['.github/CODEOWNERS', 'docs/CODEOWNERS', 'CODEOWNERS'])
+def test_codeowners_file_locations(mock_github, test_path):
     """Test CODEOWNERS file location precedence"""
     _, mock_repo = mock_github
     
-    for test_path in ['.github/CODEOWNERS', 'docs/CODEOWNERS', 'CODEOWNERS']:
-        mock_content = Mock()
-        mock_content.decoded_content = b"* @authorized-user"
-        
-        def get_contents_side_effect(path):
-            if path == test_path:
-                return mock_content
-            raise GithubException(404, "Not found")
-        
-        mock_repo.get_contents = Mock(side_effect=get_contents_side_effect)
-        ac = AccessControl(mock_repo)
-        
-        assert ac._is_authorized("authorized-user") is True
+    def get_contents_side_effect(path):
+        if path == test_path:
+            return AUTHORIZED_USER_CODEOWNERS
+        raise GithubException(404, "Not found")
+    
+    mock_repo.get_contents = Mock(side_effect=get_contents_side_effect)
+    ac = AccessControl(mock_repo)
+    
+    assert ac._is_authorized("authorized-user") is True
 
 def test_unauthorized_update_rejection(store, mock_comment):
     """Test that updates from unauthorized users are rejected"""
@@ -78,33 +99,18 @@ def test_unauthorized_update_rejection(store, mock_comment):
         user_login="attacker",
         body={
             '_data': {'malicious': 'update'},
-            '_meta': {
-                'client_version': CLIENT_VERSION,
-                'timestamp': '2025-01-01T00:00:00Z',
-                'update_mode': 'append'
-            }
+            '_meta': UPDATE_META
         }
     )
     authorized_update = mock_comment(
         user_login="repo-owner",
         body={
             '_data': {'valid': 'update'},
-            '_meta': {
-                'client_version': CLIENT_VERSION,
-                'timestamp': '2025-01-01T00:00:00Z',
-                'update_mode': 'append'
-            }
+            '_meta': UPDATE_META
         }
     )
     
-    # Setup mock issue
-    issue = Mock()
-    issue.get_comments = Mock(return_value=[unauthorized_update, authorized_update])
-    issue.user = Mock(login="repo-owner")  # Authorized creator
-    
-    # Setup repo mock to return list of issues
-    store.repo.get_issues = Mock(return_value=[issue])
-    store.repo.get_issue = Mock(return_value=issue)
+    serve_issue_comments(store, [unauthorized_update, authorized_update])
     
     # Get updates
     updates = store.comment_handler.get_unprocessed_updates(123)
@@ -130,22 +136,11 @@ def test_authorized_codeowners_updates(authorized_store, mock_comment):
         user_login="team-member",
         body={
             '_data': {'team': 'update'},
-            '_meta': {
-                'client_version': CLIENT_VERSION,
-                'timestamp': '2025-01-01T00:00:00Z',
-                'update_mode': 'append'
-            }
+            '_meta': UPDATE_META
         }
     )
     
-    # Setup mock issue
-    issue = Mock()
-    issue.get_comments = Mock(return_value=[team_update])
-    issue.user = Mock(login="repo-owner")  # Authorized creator
-    
-    # Setup repo mock to return list of issues
-    store.repo.get_issues = Mock(return_value=[issue])
-    store.repo.get_issue = Mock(return_value=issue)
+    serve_issue_comments(store, [team_update])
     
     # Get updates
     updates = store.comment_handler.get_unprocessed_updates(123)
@@ -166,14 +161,7 @@ def test_metadata_tampering_protection(store, mock_comment):
         }
     )
     
-    # Setup mock issue
-    issue = Mock()
-    issue.get_comments = Mock(return_value=[tampered_update])
-    issue.user = Mock(login="repo-owner")
-    
-    # Setup repo mock to return list of issues
-    store.repo.get_issues = Mock(return_value=[issue])
-    store.repo.get_issue = Mock(return_value=issue)
+    serve_issue_comments(store, [tampered_update])
     
     # Get updates - should be empty due to invalid metadata
     updates = store.comment_handler.get_unprocessed_updates(123)
@@ -186,24 +174,16 @@ def test_reaction_based_processing_protection(store, mock_comment):
         user_login="repo-owner",
         body={
             '_data': {'already': 'processed'},
-            '_meta': {
-                'client_version': CLIENT_VERSION,
-                'timestamp': '2025-01-01T00:00:00Z',
-                'update_mode': 'append'
-            }
+            '_meta': UPDATE_META
         },
-        reactions=[Mock(content="+1")]  # Add processed reaction
+        reactions=["+1"]  # Add processed reaction
     )
     
-    # Setup mock issue
-    issue = Mock()
-    issue.get_comments = Mock(return_value=[processed_update])
-    issue.user = Mock(login="repo-owner")
-    
-    # Setup repo mock to return list of issues
-    store.repo.get_issues = Mock(return_value=[issue])
-    store.repo.get_issue = Mock(return_value=issue)
+    serve_issue_comments(store, [processed_update])
     
     # Get updates - should be empty since update is already processed
     updates = store.comment_handler.get_unprocessed_updates(123)
     assert len(updates) == 0
+    
+    # The listed comment's reaction summary is enough; no extra request is made
+    processed_update.get_reactions.assert_not_called()
@@ -1,18 +1,25 @@
 # tests/unit/test_store_basic_ops.py
 
 import json
-from datetime import datetime, timezone
+from types import SimpleNamespace
 import pytest
 from unittest.mock import Mock
+from github import RateLimitExceededException
 
 from gh_store.core.constants import LabelNames
-from gh_store.core.exceptions import ObjectNotFound
+from gh_store.core.exceptions import DuplicateUIDError, ObjectNotFound
+from gh_store.handlers import issue as issue_module
+from tests.unit.fixtures.github import DEFAULT_CREATED_AT, LabelSet, dump_body
+
+# Object data shared by the create/get tests, serialized once at import
+TEST_DATA = {"name": "test", "value": 42}
+TEST_DATA_BODY_JSON = dump_body(TEST_DATA)
 
 
 def test_create_object_with_initial_state(store, mock_label_factory, mock_comment_factory, mock_issue_factory):
     """Test that creating an object stores the initial state in a comment"""
     object_id = "test-123"
-    test_data = {"name": "test", "value": 42}
+    test_data = TEST_DATA
     issue_number = 456  # Define issue number
     labels=[
         mock_label_factory(name=LabelNames.GH_STORE),
@@ -26,7 +33,7 @@ def test_create_object_with_initial_state(store, mock_label_factory, mock_commen
     # Create a properly configured mock issue
     mock_issue = mock_issue_factory(
         number=issue_number,
-        body=json.dumps(test_data),
+        body=TEST_DATA_BODY_JSON,
         labels=labels+[f"{LabelNames.UID_PREFIX}{object_id}"],
     )
     
@@ -41,7 +48,7 @@ def test_create_object_with_initial_state(store, mock_label_factory, mock_commen
             "_data": test_data,
             "_meta": {
                 "client_version": "1.2.3",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": DEFAULT_CREATED_AT.isoformat(),
                 "update_mode": "append",
                 "issue_number": issue_number
             }
@@ -56,7 +63,7 @@ def test_create_object_with_initial_state(store, mock_label_factory, mock_commen
     store.repo.create_issue.assert_called_once()
     
     # Verify create_issue was called with the right arguments
-    create_issue_args = store.repo.create_issue.call_args[1]
+    create_issue_args = store.repo.create_issue.call_args.kwargs
     assert create_issue_args["title"] == f"Stored Object: {object_id}"
     assert json.loads(create_issue_args["body"]) == test_data
     assert LabelNames.GH_STORE in create_issue_args["labels"]
@@ -72,28 +79,20 @@ def test_create_object_with_initial_state(store, mock_label_factory, mock_commen
     assert obj.data == test_data
 
 
-def test_get_object(store):
+def test_get_object(store, mock_issue_factory, mock_label_factory):
     """Test retrieving an object"""
-    test_data = {"name": "test", "value": 42}
+    test_data = TEST_DATA
     issue_number = 42  # Define issue number
     
     # Mock labels - should include both stored-object and gh-store
-    stored_label = Mock()
-    stored_label.name = "stored-object"
-    gh_store_label = Mock()
-    gh_store_label.name = LabelNames.GH_STORE
-    uid_label = Mock()
-    uid_label.name = "UID:test-obj"
-    
-    store.repo.get_labels.return_value = [stored_label, gh_store_label, uid_label]
-    
-    mock_issue = Mock()
-    mock_issue.number = issue_number  # Set issue number
-    mock_issue.body = json.dumps(test_data)
-    mock_issue.get_comments = Mock(return_value=[])
-    mock_issue.created_at = datetime.now(timezone.utc)
-    mock_issue.updated_at = datetime.now(timezone.utc)
-    mock_issue.labels = [stored_label, gh_store_label, uid_label]
+    labels = [
+        mock_label_factory("stored-object"),
+        mock_label_factory(LabelNames.GH_STORE),
+        mock_label_factory("UID:test-obj"),
+    ]
+    store.repo.get_labels.return_value = labels
+    
+    mock_issue = mock_issue_factory(number=issue_number, body=TEST_DATA_BODY_JSON, labels=labels)
     store.repo.get_issues.return_value = [mock_issue]
     
     obj = store.get("test-obj")
@@ -102,7 +101,7 @@ def test_get_object(store):
     
     # Verify correct query was made (now checking for all three labels)
     store.repo.get_issues.assert_called_with(
-        labels=[LabelNames.GH_STORE.value, LabelNames.STORED_OBJECT.value, "UID:test-obj"],
+        labels=LabelSet(LabelNames.GH_STORE, LabelNames.STORED_OBJECT, "UID:test-obj"),
         #state="closed"
     )
 
@@ -113,5 +112,34 @@ def test_get_nonexistent_object(store):
     with pytest.raises(ObjectNotFound):
         store.get("nonexistent")
 
+def test_get_object_retries_rate_limited_lookups(store, mock_issue_factory, monkeypatch):
+    """Test that rate-limited lookups back off and retry before giving up"""
+    sleep = Mock()
+    monkeypatch.setattr(issue_module, "sleep", sleep)
+    issue = mock_issue_factory(body=TEST_DATA_BODY_JSON, labels=["UID:test-obj"])
+    store.repo.get_issues.side_effect = [
+        RateLimitExceededException(403, "rate limited", None),
+        [issue],
+    ]
+    
+    obj = store.get("test-obj")
+    
+    assert obj.data == TEST_DATA
+    sleep.assert_called_once_with(1)  # backoff_factor ** 0
+    
+    # Exhausting every attempt surfaces the rate limit error
+    store.repo.get_issues.side_effect = RateLimitExceededException(403, "rate limited", None)
+    with pytest.raises(RateLimitExceededException):
+        store.get("test-obj")
+    assert store.repo.get_issues.call_count == 2 + store.config.store.retries.max_attempts
+
+def test_get_object_with_duplicate_uid(store):
+    """Test that an ID matching several issues is rejected"""
+    # Only the issue numbers are read before raising
+    store.repo.get_issues.return_value = [SimpleNamespace(number=1), SimpleNamespace(number=2)]
+    
+    with pytest.raises(DuplicateUIDError, match=r"\[1, 2\]"):
+        store.get("test-obj")
+
 def test_create_object_ensures_labels_exist(store, mock_issue_factory, mock_label_factory):
     pass
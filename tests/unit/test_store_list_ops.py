@@ -1,16 +1,32 @@
 # tests/unit/test_store_list_ops.py
 
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+from datetime import datetime, timedelta, timezone
 import pytest
-from unittest.mock import Mock
+from unittest.mock import patch
 
 from gh_store.core.constants import LabelNames
+from gh_store.core.store import GitHubStore, GITHUB_PAGE_SIZE
+from gh_store.core.types import StoredObject
+from tests.unit.fixtures.github import LabelSet
+
+# Fixed reference point for the "updated since" queries
+LAST_SNAPSHOT_TIME = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def make_stored_issue(mock_issue_factory):
+    """Factory for stored-object issues carrying the standard gh-store labels"""
+    def _create(number, uid=None, extra_labels=()):
+        labels = ["gh-store", "stored-object"]
+        if uid is not None:
+            labels.append(f"UID:{uid}")
+        return mock_issue_factory(number=number, labels=[*labels, *extra_labels])
+    return _create
 
 
 def test_list_updated_since(store, mock_issue_factory):
     """Test fetching objects updated since timestamp"""
-    timestamp = datetime.now(ZoneInfo("UTC")) - timedelta(hours=1)
+    timestamp = LAST_SNAPSHOT_TIME
     object_id = "test-123"
     
     # Create mock issue updated after timestamp - include gh-store label
@@ -21,25 +37,20 @@ def test_list_updated_since(store, mock_issue_factory):
     )
     store.repo.get_issues.return_value = [issue]
     
-    # Mock object retrieval
-    # mock_obj = Mock()
-    # mock_obj.meta.updated_at = timestamp + timedelta(minutes=30)
-    # store.issue_handler.get_object_by_number = Mock(return_value=mock_obj)
-    
     # Test listing
     updated = list(store.list_updated_since(timestamp))
     
     # Verify
     store.repo.get_issues.assert_called_once()
-    call_kwargs = store.repo.get_issues.call_args[1]
+    call_kwargs = store.repo.get_issues.call_args.kwargs
     assert call_kwargs["since"] == timestamp
-    assert call_kwargs["labels"] == [LabelNames.GH_STORE, LabelNames.STORED_OBJECT]  # Query by stored-object for active objects
+    assert call_kwargs["labels"] == LabelSet(LabelNames.GH_STORE, LabelNames.STORED_OBJECT)  # Query by stored-object for active objects
     assert len(updated) == 1
     assert updated[0].meta.object_id == object_id
 
 def test_list_updated_since_no_updates(store, mock_issue):
     """Test when no updates since timestamp"""
-    timestamp = datetime.now(ZoneInfo("UTC")) - timedelta(hours=1)
+    timestamp = LAST_SNAPSHOT_TIME
     
     # Create mock issue updated before timestamp
     issue = mock_issue(
@@ -49,125 +60,48 @@ def test_list_updated_since_no_updates(store, mock_issue):
     )
     store.repo.get_issues.return_value = [issue]
     
-    # Mock object retrieval
-    mock_obj = Mock()
-    mock_obj.meta.updated_at = timestamp - timedelta(minutes=30)
-    store.issue_handler.get_object_by_number = Mock(return_value=mock_obj)
-    
     # Test listing
-    updated = list(store.list_updated_since(timestamp))
+    with patch.object(StoredObject, "from_issue") as from_issue:
+        updated = list(store.list_updated_since(timestamp))
     
-    # Verify no updates found
+    # Verify no updates found, without parsing the stale issue's body
     assert len(updated) == 0
+    from_issue.assert_not_called()
 # Updates needed for test_store_list_ops.py
 
-def test_list_all_objects(store, mock_issue, mock_label_factory):
+@pytest.mark.parametrize("issue_specs,expected", [
+    # (number, uid, extra_labels) per issue
+    ([(1, "test-1", ()), (2, "test-2", ())], {"test-1", "test-2"}),
+    # Archived objects are skipped
+    ([(1, "test-1", ("archived",)), (2, "test-2", ())], {"test-2"}),
+    # Issues missing a UID label are skipped
+    ([(1, None, ()), (2, "test-2", ())], {"test-2"}),
+    ([], set()),
+], ids=["all", "skips-archived", "skips-invalid-labels", "empty"])
+def test_list_all(store, make_stored_issue, issue_specs, expected):
     """Test listing all objects in store"""
-    # Create mock issues with proper labels - include gh-store label
-    issues = [
-        mock_issue(
-            number=1,
-            labels=["gh-store", "stored-object", f"UID:test-1"],
-        ),
-        mock_issue(
-            number=2,
-            labels=["gh-store", "stored-object", f"UID:test-2"],
-        )
+    store.repo.get_issues.return_value = [
+        make_stored_issue(number, uid, extra_labels)
+        for number, uid, extra_labels in issue_specs
     ]
-    store.repo.get_issues.return_value = issues
-    
-    # Mock object retrieval
-    def get_object_by_number(number):
-        mock_obj = Mock()
-        mock_obj.meta.object_id = f"test-{number}"
-        return mock_obj
-    
-    store.issue_handler.get_object_by_number = Mock(
-        side_effect=get_object_by_number
-    )
     
     # Test listing all
-    objects = [obj.meta.object_id for obj in list(store.list_all())]
+    objects = [obj.meta.object_id for obj in store.list_all()]
     
-    # Verify
-    assert len(objects) == 2
-    assert "test-1" in objects
-    assert "test-2" in objects
+    # Verify each expected object is listed exactly once
+    assert len(objects) == len(expected)
+    assert set(objects) == expected
     
     # Verify the query was made with stored-object label
     store.repo.get_issues.assert_called_with(
         state="closed",
-        labels=["gh-store", "stored-object"]
-    )
-
-def test_list_all_skips_archived(store, mock_issue, mock_label_factory):
-    """Test that archived objects are skipped in listing"""
-    # Create archived and active issues - include gh-store label
-    archived_issue = mock_issue(
-        number=1,
-        labels=[
-            "gh-store",
-            "stored-object",
-            "UID:test-1",
-            "archived",
-        ]
-    )
-    active_issue = mock_issue(
-        number=2,
-        labels=["gh-store", "stored-object", "UID:test-2"]
-    )
-    
-    store.repo.get_issues.return_value = [archived_issue, active_issue]
-    
-    # Mock object retrieval
-    def get_object_by_number(number):
-        mock_obj = Mock()
-        mock_obj.meta.object_id = f"test-{number}"
-        return mock_obj
-    
-    store.issue_handler.get_object_by_number = Mock(
-        side_effect=get_object_by_number
+        labels=LabelSet("gh-store", "stored-object")
     )
-    
-    # Test listing
-    objects = [obj.meta.object_id for obj in list(store.list_all())]
-    
-    # Verify only active object listed
-    # 
-    assert len(objects) == 1
-    assert "test-2" in objects
-    assert "test-1" not in objects
 
-def test_list_all_handles_invalid_labels(store, mock_issue, mock_label_factory):
-    """Test handling of issues with invalid label structure"""
-    # Create issue missing UID label
-    invalid_issue = mock_issue(
-        number=1,
-        labels=["gh-store", "stored-object"]  # Missing UID label
-    )
+def test_store_requests_max_page_size(mock_github):
+    """Test that listing requests use GitHub's largest page size"""
+    mock_gh, _ = mock_github
     
-    # Create valid issue with explicit labels including UID
-    valid_issue = mock_issue(
-        number=2,
-        labels=["gh-store", "stored-object","UID:test-2"]  # Explicitly set UID label
-    )
-    
-    store.repo.get_issues.return_value = [invalid_issue, valid_issue]
-    
-    # Mock object retrieval
-    def get_object_by_number(number):
-        mock_obj = Mock()
-        mock_obj.meta.object_id = f"test-{number}"
-        mock_obj.meta.label = f"UID:test-{number}"
-        return mock_obj
-    
-    store.issue_handler.get_object_by_number = Mock(
-        side_effect=get_object_by_number
-    )
-    
-    # Test listing
-    objects = [obj.meta.object_id for obj in list(store.list_all())]
+    GitHubStore(token="fake-token", repo="owner/repo")
     
-    # Verify only valid object listed
-    assert len(objects) == 1
-    assert "test-2" in objects
+    mock_gh.assert_called_once_with("fake-token", per_page=GITHUB_PAGE_SIZE)
@@ -1,140 +1,88 @@
 # tests/unit/test_store_update_ops.py
 
 import json
-from datetime import datetime, timezone
 import pytest
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock
 
 from gh_store.core.constants import LabelNames
 from gh_store.core.exceptions import ConcurrentUpdateError, ObjectNotFound
 from gh_store.core.version import CLIENT_VERSION
 
-def test_process_update(store, mock_issue_factory):
-    """Test processing an update"""
-    test_data = {"name": "test", "value": 42}
-    mock_issue = mock_issue_factory(body=test_data, number=123, labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, f"{LabelNames.UID_PREFIX}:test-obj"])
-    
+# Labels of the stored object most update tests operate on
+TEST_OBJ_LABELS = (LabelNames.GH_STORE, LabelNames.STORED_OBJECT, f"{LabelNames.UID_PREFIX}test-obj")
+
+def issues_by_state(open_issues, other_issues):
+    """Build a get_issues side effect answering open-state queries separately."""
     def get_issues_side_effect(**kwargs):
         if kwargs.get("state") == "open":
-            return []  # No issues being processed
-        return [mock_issue]
-    
-    store.repo.get_issues.side_effect = get_issues_side_effect
-    store.repo.get_issue.return_value = mock_issue
+            return open_issues
+        return other_issues
+    return get_issues_side_effect
+
+@pytest.fixture
+def updatable_issue(store, mock_issue_factory):
+    """Factory wiring a "test-obj" issue with no update in progress into the store's repo."""
+    def _create(body):
+        issue = mock_issue_factory(number=123, body=body, labels=TEST_OBJ_LABELS)
+        # No issues being processed
+        store.repo.get_issues.side_effect = issues_by_state([], [issue])
+        store.repo.get_issue.return_value = issue
+        return issue
+    
+    return _create
+
+@pytest.mark.parametrize("initial,update", [
+    ({"name": "test", "value": 42}, {"value": 43}),
+    ({"initial": "data"}, {"new": "value"}),
+], ids=["changed-field", "new-field"])
+def test_process_update(store, updatable_issue, initial, update):
+    """Test that an update posts a properly structured comment and reopens the issue"""
+    mock_issue = updatable_issue(initial)
     
-    # Test update
-    update_data = {"value": 43}
-    store.update("test-obj", update_data)
+    store.update("test-obj", update)
     
-    # Verify update comment
+    # Verify comment structure
     mock_issue.create_comment.assert_called_once()
-    comment_data = json.loads(mock_issue.create_comment.call_args[0][0])
-    assert comment_data["_data"] == update_data
-    assert "_meta" in comment_data
-    assert all(key in comment_data["_meta"] for key in ["client_version", "timestamp", "update_mode"])
+    comment_data = json.loads(mock_issue.create_comment.call_args.args[0])
+    assert comment_data == {
+        "_data": update,
+        "_meta": {
+            "client_version": CLIENT_VERSION,
+            "timestamp": ANY,
+            "update_mode": "append",
+            "issue_number": 123,
+        },
+    }
     
     # Verify issue reopened
     mock_issue.edit.assert_called_with(state="open")
 
-# def test_concurrent_update_prevention(store, mock_issue_factory, mock_comment_factory):
-#     """Test that concurrent updates are prevented with minimal changes"""
-#     # Create a mock issue with one unprocessed comment
-#     comments_1 = [
-#         mock_comment_factory(
-#             body={"value": 42},
-#             comment_id=1,
-#             reactions=[]
-#         )
-#     ]
-    
-#     mock_issue = mock_issue_factory(
-#         state="open",
-#         number=123,
-#         labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, f"{LabelNames.UID_PREFIX}test-obj"]
-#     )
-#     mock_issue.get_comments.return_value = comments_1
-
-#     # check if I've gone crazy
-#     # for comment in mock_issue.get_comments():
-#     #     assert [comment] == comments_1
-    
-    
-#     # Configure both get_issues and get_issue to use our mock issue
-#     def get_issues_side_effect(**kwargs):
-#         if kwargs.get("state") == "open":
-#             return [mock_issue]
-#         return []
-    
-#     store.repo.get_issues.side_effect = get_issues_side_effect
-#     store.repo.get_issues.return_value = [mock_issue]
-#     # The critical line - ensure get_issue returns the same mock object
-#     store.repo.get_issue.return_value = mock_issue
-    
-#     # First update should work (1 comment)
-#     store.update("test-obj", {"value": 43})
-    
-#     # Update the same mock to have 2 comments
-#     comments_2 = [
-#         mock_comment_factory(
-#             body={"value": 42},
-#             comment_id=i,
-#             reactions=[]
-#         ) for i in range(1, 3)  # 2 comments
-#     ]
-#     mock_issue.get_comments.return_value = comments_2
-    
-#     # Second update should work (2 comments)
-#     store.update("test-obj", {"value": 44})
-    
-#     # Update the same mock to have 3 comments (exceeding limit)
-#     comments_3 = [
-#         mock_comment_factory(
-#             body={"value": 42},
-#             comment_id=i,
-#             reactions=[]
-#         ) for i in range(1, 4)  # 3 comments
-#     ]
-#     mock_issue.get_comments.return_value = comments_3
-    
-#     # Third update should fail
-#     with pytest.raises(ConcurrentUpdateError):
-#         store.update("test-obj", {"value": 45})
-
-def test_update_metadata_structure(store, mock_issue_factory):
-    """Test that updates include properly structured metadata"""
-    # mock_issue = Mock()
-    # mock_issue.body = json.dumps({"initial": "data"})
-    # mock_issue.get_comments = Mock(return_value=[])
-    # mock_issue.number = 123
-    # mock_issue.user = Mock()
-    # mock_issue.user.login = "repo-owner"  # Set authorized user
+@pytest.mark.parametrize("n_pending,should_raise", [
+    (1, False),
+    (2, False),
+    (3, True),
+], ids=["one-pending", "at-limit", "over-limit"])
+def test_concurrent_update_prevention(store, mock_issue_factory, mock_comment_factory, n_pending, should_raise):
+    """Test that updates are refused once too many are already queued"""
     mock_issue = mock_issue_factory(
-        number = 123,
-        body={"initial": "data"}, 
-        labels=[LabelNames.GH_STORE, LabelNames.STORED_OBJECT, f"{LabelNames.UID_PREFIX}test-obj"]
+        state="open",
+        number=123,
+        labels=TEST_OBJ_LABELS,
+        comments=[
+            mock_comment_factory(body={"value": 42}, comment_id=i)
+            for i in range(1, n_pending + 1)
+        ],
     )
-    
-    def get_issues_side_effect(**kwargs):
-        if kwargs.get("state") == "open":
-            return []  # No concurrent processing
-        return [mock_issue]
-    
-    store.repo.get_issues.side_effect = get_issues_side_effect
-    store.repo.get_issue.return_value = mock_issue
-    
-    update_data = {"new": "value"}
-    store.update("test-obj", update_data)
-    
-    # Verify comment structure
-    mock_issue.create_comment.assert_called_once()
-    comment_data = json.loads(mock_issue.create_comment.call_args[0][0])
-    
-    assert "_data" in comment_data
-    assert "_meta" in comment_data
-    assert comment_data["_meta"]["client_version"] == CLIENT_VERSION
-    assert comment_data["_meta"]["update_mode"] == "append"
-    assert "timestamp" in comment_data["_meta"]
-
+    store.repo.get_issues.side_effect = issues_by_state([mock_issue], [mock_issue])
+    store.repo.get_issue = Mock(return_value=mock_issue)
+    
+    if should_raise:
+        with pytest.raises(ConcurrentUpdateError):
+            store.update("test-obj", {"value": 43})
+        mock_issue.create_comment.assert_not_called()
+    else:
+        store.update("test-obj", {"value": 43})
+        mock_issue.create_comment.assert_called_once()
 
 def test_update_nonexistent_object(store):
     """Test updating an object that doesn't exist"""
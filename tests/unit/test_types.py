@@ -1,12 +1,16 @@
 # tests/unit/test_types.py
 
 import json
-from datetime import datetime, timezone
+from types import SimpleNamespace
 import pytest
-from unittest.mock import Mock
 
 from gh_store.core.constants import LabelNames
 from gh_store.core.types import StoredObject, get_object_id_from_labels
+from tests.unit.fixtures.github import DEFAULT_CREATED_AT, DEFAULT_UPDATED_AT, dump_body
+
+# Issue payload for the from_issue tests, serialized once at import
+OBJECT_DATA = {"name": "test", "value": 42}
+OBJECT_BODY_JSON = dump_body(OBJECT_DATA)
 
 class TestStoredObject:
     """Tests for StoredObject class."""
@@ -16,14 +20,14 @@ class TestStoredObject:
         # Create test data
         object_id = "test-123"
         issue_number = 42
-        created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
-        updated_at = datetime(2025, 1, 2, tzinfo=timezone.utc)
-        data = {"name": "test", "value": 42}
+        created_at = DEFAULT_CREATED_AT
+        updated_at = DEFAULT_UPDATED_AT
+        data = OBJECT_DATA
         
         # Create a properly labeled mock issue
         issue = mock_issue_factory(
             number=issue_number,
-            body=json.dumps(data),
+            body=OBJECT_BODY_JSON,
             labels=[
                 "gh-store",
                 "stored-object",
@@ -51,12 +55,12 @@ class TestStoredObject:
         """Test creating a StoredObject with explicit version number."""
         # Create test data
         object_id = "test-123"
-        data = {"name": "test", "value": 42}
+        data = OBJECT_DATA
         version = 5
         
         # Create a properly labeled mock issue
         issue = mock_issue_factory(
-            body=json.dumps(data),
+            body=OBJECT_BODY_JSON,
             labels=[
                 "gh-store",
                 "stored-object",
@@ -74,7 +78,7 @@ class TestStoredObject:
         """Test that creating a StoredObject fails when UID label is missing."""
         # Create an issue missing the UID label
         issue = mock_issue_factory(
-            body=json.dumps({"name": "test"}),
+            body={"name": "test"},
             labels=["gh-store", "stored-object"]  # No UID label
         )
         
@@ -105,12 +109,11 @@ class TestObjectIDFromLabels:
         """Test extracting object ID from issue labels."""
         # Create an issue with mock labels
         object_id = "test-123"
-        issue = Mock()
-        issue.labels = [
+        issue = SimpleNamespace(labels=[
             mock_label_factory(name="stored-object"),
             mock_label_factory(name=f"{LabelNames.UID_PREFIX}{object_id}"),
             mock_label_factory(name="other-label")
-        ]
+        ])
         
         # Extract object ID
         extracted_id = get_object_id_from_labels(issue)
@@ -121,11 +124,10 @@ class TestObjectIDFromLabels:
     def test_get_object_id_from_labels_no_match(self, mock_label_factory):
         """Test that ValueError is raised when no UID label exists."""
         # Create an issue with no UID label
-        issue = Mock()
-        issue.labels = [
+        issue = SimpleNamespace(labels=[
             mock_label_factory(name="stored-object"),
             mock_label_factory(name="other-label")
-        ]
+        ])
         
         # Should raise ValueError
         with pytest.raises(ValueError):